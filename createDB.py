@@ -37,6 +37,7 @@ def createScheduleDB(conn):
             hall_id			int,
             month_id		int,
             created			date,
+            fingerprint		varchar(64),
 
         PRIMARY KEY (id),
         FOREIGN KEY (hall_id) REFERENCES res_hall(id),
@@ -261,6 +262,9 @@ def createSchedulerQueueDB(conn):
             res_hall_id     int NOT NULL,
             created_ra_id   int NOT NULL,
             created_date    timestamp NOT NULL WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+            stats           json,
+            month_num       int,
+            year            int,
             
             PRIMARY KEY (id),
             FOREIGN KEY (res_hall_id) REFERENCES res_hall(id),
@@ -268,6 +272,25 @@ def createSchedulerQueueDB(conn):
         );""")
 
 
+def createSchedulerRunHistoryDB(conn):
+    conn.execute("DROP TABLE IF EXISTS scheduler_run_history CASCADE;")
+    conn.execute("""
+        CREATE TABLE scheduler_run_history(
+            id              serial UNIQUE,
+            res_hall_id     int NOT NULL,
+            num_ras         int NOT NULL,
+            ldat            int NOT NULL,
+            status          int NOT NULL,
+            seconds         real NOT NULL,
+            nodes           int,
+            budget_exhausted boolean NOT NULL DEFAULT FALSE,
+            created_date    timestamp WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            
+            PRIMARY KEY (id),
+            FOREIGN KEY (res_hall_id) REFERENCES res_hall(id)
+        );""")
+
+
 def main():
     conn = psycopg2.connect(os.environ["DATABASE_URL"])
     createSchoolDB(conn.cursor())
@@ -286,6 +309,7 @@ def main():
     createHallSettingsDB(conn.cursor())
     createStaffMembershipDB(conn.cursor())
     createSchedulerQueueDB(conn.cursor())
+    createSchedulerRunHistoryDB(conn.cursor())
 
     conn.commit()
 
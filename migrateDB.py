@@ -42,6 +42,121 @@ def migrate(conn):
 
         logging.info("  Finished adding 'enabled' column to res_hall table")
 
+    # -------------------------------------------------
+    # --  Add stats column to scheduler_queue table  --
+    # -------------------------------------------------
+
+    # Check to see if the column already exists
+    cur.execute(
+        """SELECT EXISTS (
+            SELECT column_name 
+            FROM information_schema.columns 
+            WHERE table_name='scheduler_queue' 
+            AND column_name='stats');"""
+    )
+
+    # If the column does not already exist...
+    if not cur.fetchone()[0]:
+        logging.info("  Adding 'stats' column to scheduler_queue table")
+
+        # Create the column in the scheduler_queue. This column is left as
+        #  NULL until the scheduler has processed the request.
+        cur.execute("""
+            ALTER TABLE scheduler_queue
+            ADD COLUMN stats json
+            ;""")
+
+        logging.info("  Finished adding 'stats' column to scheduler_queue table")
+
+    # ----------------------------------------------------------------
+    # --  Add month_num and year columns to scheduler_queue table  --
+    # ----------------------------------------------------------------
+
+    # Check to see if the columns already exist
+    cur.execute(
+        """SELECT EXISTS (
+            SELECT column_name 
+            FROM information_schema.columns 
+            WHERE table_name='scheduler_queue' 
+            AND column_name='month_num');"""
+    )
+
+    # If the columns do not already exist...
+    if not cur.fetchone()[0]:
+        logging.info("  Adding 'month_num' and 'year' columns to scheduler_queue table")
+
+        # Create the columns in the scheduler_queue. These are left as NULL
+        #  for the requests that were made before they existed.
+        cur.execute("""
+            ALTER TABLE scheduler_queue
+            ADD COLUMN month_num int,
+            ADD COLUMN year int
+            ;""")
+
+        logging.info("  Finished adding 'month_num' and 'year' columns to scheduler_queue table")
+
+    # ---------------------------------------------------
+    # --  Add fingerprint column to schedule table  --
+    # ---------------------------------------------------
+
+    # Check to see if the fingerprint column already exists
+    cur.execute(
+        """SELECT EXISTS (
+            SELECT column_name 
+            FROM information_schema.columns 
+            WHERE table_name='schedule' 
+            AND column_name='fingerprint');"""
+    )
+
+    # If the fingerprint column does not already exist...
+    if not cur.fetchone()[0]:
+        logging.info("  Adding 'fingerprint' column to schedule table")
+
+        # Create the fingerprint column in the schedule table. Schedules that
+        #  were made before this column existed are left as NULL so that they
+        #  are never reused by the scheduler.
+        cur.execute("""
+            ALTER TABLE schedule
+            ADD COLUMN fingerprint varchar(64)
+            ;""")
+
+        logging.info("  Finished adding 'fingerprint' column to schedule table")
+
+    # ---------------------------------------
+    # --  Add scheduler_run_history table  --
+    # ---------------------------------------
+
+    # Check to see if the table already exists
+    cur.execute(
+        """SELECT EXISTS (
+            SELECT table_name 
+            FROM information_schema.tables 
+            WHERE table_name='scheduler_run_history');"""
+    )
+
+    # If the table does not already exist...
+    if not cur.fetchone()[0]:
+        logging.info("  Adding scheduler_run_history table")
+
+        # Create the table
+        cur.execute("""
+            CREATE TABLE scheduler_run_history(
+                id              serial UNIQUE,
+                res_hall_id     int NOT NULL,
+                num_ras         int NOT NULL,
+                ldat            int NOT NULL,
+                status          int NOT NULL,
+                seconds         real NOT NULL,
+                nodes           int,
+                budget_exhausted boolean NOT NULL DEFAULT FALSE,
+                created_date    timestamp WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                
+                PRIMARY KEY (id),
+                FOREIGN KEY (res_hall_id) REFERENCES res_hall(id)
+            );""")
+
+        logging.info("  Finished adding scheduler_run_history table")
+
 
 if __name__ == "__main__":
 
@@ -1,6 +1,14 @@
 from datetime import date
 import calendar
 import random
+import heapq
+
+# NumPy is optional. It is only needed when the duty candidates are scored
+#  with State.ScoringArrays.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class RA:
@@ -23,6 +31,11 @@ class RA:
                                     earned through their assigned monthly duties.
     """
 
+    # The attributes of the RA object. Declaring these keeps the RA objects compact
+    #  since the scheduler creates and copies many of them.
+    __slots__ = ("firstName", "lastName", "fullName", "id", "hallId", "conflicts", "conflictSet",
+                 "conflictMask", "dateStarted", "points", "hashVal")
+
     def __init__(self, firstName, lastName, raID, hallID, dateStarted, conflicts=None, points=0):
 
         # First name of the RA
@@ -43,12 +56,27 @@ class RA:
         # Conflicts of the RA
         self.conflicts = [] if conflicts is None else list(conflicts)
 
+        # A frozen set of the RA's conflicts for constant time lookups
+        self.conflictSet = frozenset(self.conflicts)
+
+        # A bitmask of the RA's conflicts where bit 'n' is set if the RA has a
+        #  conflict on the 'n'th day of the month. Only integer conflicts, which
+        #  is how the scheduler represents dates, are included in the mask.
+        self.conflictMask = 0
+        for con in self.conflictSet:
+            if isinstance(con, int) and con >= 0:
+                self.conflictMask |= 1 << con
+
         # Date representing the date that the RA began employment
         self.dateStarted = dateStarted
 
         # Points earned by the RA through their assigned monthly duties
         self.points = points
 
+        # The hash of the RA object. None of the hashed attributes change once
+        #  the RA has been created, so the hash is only calculated once.
+        self.hashVal = hash((self.fullName, self.id, self.hallId, str(self.dateStarted)))
+
     def __str__(self):
         # Return a string representing the RA object
         return "{} has {} points".format(self.fullName, self.points)
@@ -71,10 +99,14 @@ class RA:
         #    hallId
         #    dateStarted
 
-        return self.fullName == other.fullName and \
-               self.id == other.id and \
-               self.hallId == other.hallId and \
-               self.dateStarted == other.dateStarted
+        #  The id is checked first since it is the attribute that is most
+        #  likely to differ.
+
+        return self is other or \
+            (self.id == other.id and
+             self.fullName == other.fullName and
+             self.hallId == other.hallId and
+             self.dateStarted == other.dateStarted)
 
     def __hash__(self):
         # Return a hash of the RA object that is based on a tuple of the
@@ -85,7 +117,10 @@ class RA:
         #    hallId
         #    dateStarted
 
-        return hash((self.fullName, self.id, self.hallId, str(self.dateStarted)))
+        #
+        #  This value is calculated when the RA is created.
+
+        return self.hashVal
 
     def __lt__(self, other):
         # Sort by comparing the number of points RAs have.
@@ -125,6 +160,21 @@ class RA:
         # Return the RA's conflicts
         return self.conflicts
 
+    def getConflictMask(self):
+        # Return the bitmask of the RA's conflicts
+        return self.conflictMask
+
+    def hasConflict(self, date):
+        # Return whether or not the RA has a conflict on the given date
+
+        # If the date is a day of the month, then simply check the
+        #  corresponding bit in the conflict mask.
+        if isinstance(date, int) and date >= 0:
+            return (self.conflictMask >> date) & 1 == 1
+
+        # Otherwise fall back to checking the set of conflicts
+        return date in self.conflictSet
+
     def getId(self):
         # Return the RA's ID
         return self.id
@@ -186,6 +236,10 @@ class Day:
                                        duty slot. If set to True, the last duty slot will be flagged.
     """
 
+    # The attributes of the Day object. Declaring these keeps the Day objects compact
+    #  since the scheduler creates many of them.
+    __slots__ = ("date", "dow", "isdd", "id", "review", "flagDutySlot", "ras", "numDutySlots", "pointVal")
+
     def __init__(self, date, dow, numDutySlots=1, ras=None, customPointVal=0, dayID=0,
                  isDoubleDay=False, flagDutySlot=False):
         # The date of the Day object
@@ -518,6 +572,9 @@ class Day:
                                        flagged as a special duty.
         """
 
+        # The attributes of the DutySlot object
+        __slots__ = ("slot", "flagged")
+
         def __init__(self, assignee=None, flagged=False):
             # If this object is created with an assigned RA,
             #  set it to the duty slot.
@@ -608,6 +665,9 @@ class Schedule:
         # The status of the schedule object
         self.status = status
 
+        # A dictionary of statistics describing how the schedule was generated
+        self.stats = {}
+
         # If 'sched' is defined...
         if sched is not None:
             # then use this as the defined schedule.
@@ -755,6 +815,9 @@ class Schedule:
                 status  (int):    An integer denoting the status of the message.
         """
 
+        # The attributes of the Note object
+        __slots__ = ("msg", "status")
+
         def __init__(self, msg, status):
             # Set the associated parameters
 
@@ -781,6 +844,16 @@ class Schedule:
         # Return the list of notes associated with the schedule.
         return self.schedNotes
 
+    def addStats(self, stats):
+        # Add the provided statistics to the schedule's stats dictionary,
+        #  replacing any statistics that have already been recorded with
+        #  the same name.
+        self.stats.update(stats)
+
+    def getStats(self):
+        # Return the dictionary of statistics associated with the schedule.
+        return self.stats
+
 
 class State:
     """ Object for storing information regarding the current "state" of the Scheduler's DFS traversal.
@@ -805,10 +878,34 @@ class State:
                                             whether this particular date/duty was preset.
             overrideConflicts   (bool):    Boolean denoting whether or not to allow for the
                                             overriding of duty conflicts when necessary.
+            runningTotals       (RunningTotals): Optional RunningTotals object that is shared by the
+                                            States of a traversal. If provided, it is used to
+                                            calculate the averages for the candidate scores
+                                            rather than summing over all of the RAs, and it
+                                            is kept up to date as RAs are assigned and removed.
+            lazyCandidates      (bool):    Boolean denoting whether the candList and conList
+                                            should be kept as heaps of (score, position, RA)
+                                            entries rather than fully sorted lists of RAs. The
+                                            candidates are popped in the same order either way,
+                                            but the heaps avoid sorting every RA for each State
+                                            when only the first few candidates are ever tried.
+            scoringArrays       (ScoringArrays): Optional ScoringArrays object that is shared by the
+                                            States of a traversal. If provided, the candidates
+                                            are filtered and scored using its NumPy arrays rather
+                                            than one RA at a time, and it is kept up to date by
+                                            assignNextRA and undoAssignments. The raList must be
+                                            the list that the ScoringArrays were created with, or
+                                            a subset of it in the same order.
     """
 
+    # The attributes of the State object. Declaring these keeps the State objects
+    #  compact since the scheduler creates and copies many of them.
+    __slots__ = ("curDay", "lda", "ndd", "ldaTol", "nddTol", "nfd", "predetermined", "overrideCons",
+                 "totals", "arrays", "undoLog", "lazyCands", "candList", "conList")
+
     def __init__(self, day, raList, lastDateAssigned, numDoubleDays, ldaTolerance,
-                 nddTolerance, numFlagDuties, predetermined=False, overrideConflicts=False):
+                 nddTolerance, numFlagDuties, predetermined=False, overrideConflicts=False,
+                 runningTotals=None, lazyCandidates=False, scoringArrays=None):
         # The current day of the state
         self.curDay = day
 
@@ -833,11 +930,32 @@ class State:
         # Whether or not to override duty conflicts if needed
         self.overrideCons = overrideConflicts
 
+        # The running totals shared across the traversal, if any
+        self.totals = runningTotals
+
+        # The scoring arrays shared across the traversal, if any
+        self.arrays = scoringArrays
+
+        # A log of the assignments made on this state's day. Each entry is a tuple
+        #  of (RA, previous lastDateAssigned value, whether the duty was flagged)
+        #  so that the assignment can be reverted in place when backtracking.
+        self.undoLog = []
+
+        # Whether the candList and conList are kept as heaps
+        self.lazyCands = lazyCandidates
+
         # If this state has been predetermined, then the first RA in the raList
         #  will always be selected as the for duty on this day.
         if self.predetermined:
-            # Set the provided raList as the candidate list
-            self.candList = raList
+            if self.lazyCands:
+                # Keep the provided order of the raList. A list of entries with
+                #  increasing scores is already a valid heap.
+                self.candList = [(pos, pos, ra) for pos, ra in enumerate(raList)]
+
+            else:
+                # Set the provided raList as the candidate list
+                self.candList = raList
+
             self.conList = list()
 
         elif len(raList) == 0:
@@ -846,41 +964,59 @@ class State:
             self.candList = list()
             self.conList = list()
 
+        elif self.lazyCands:
+            # Otherwise, if we are keeping lazy candidates, then score the
+            #  candidates and conflicts and heapify them rather than sorting.
+            self.candList, self.conList = self.getScoredWorkableRAs(
+                raList, self.curDay, self.lda, self.curDay.isDoubleDay(),
+                self.ndd, self.curDay.getPoints(), self.ldaTol,
+                self.nddTol, self.nfd, self.totals, self.arrays
+            )
+
+            heapq.heapify(self.candList)
+            heapq.heapify(self.conList)
+
         else:
             # Otherwise we will calculate the ordered candidate list and
             #  conflict list for this state.
             self.candList, self.conList = self.getSortedWorkableRAs(
                 raList, self.curDay, self.lda, self.curDay.isDoubleDay(),
                 self.ndd, self.curDay.getPoints(), self.ldaTol,
-                self.nddTol, self.nfd
+                self.nddTol, self.nfd, self.totals, self.arrays
             )
 
     def __deepcopy__(self):
         # Return a new State object with all of the same attributes as this State
         return State(
             self.curDay,
-            self.candList,
+            self.getCandidates(),
             self.lda.copy(),
             self.ndd.copy(),
             self.ldaTol,
             self.nddTol,
             self.nfd.copy(),
             self.predetermined,
-            self.overrideCons
+            self.overrideCons,
+            None if self.totals is None else self.totals.copy(),
+            self.lazyCands,
+            None if self.arrays is None else self.arrays.copy()
         )
 
     def __copy__(self):
         # Return a new State object that is a shallow copy of this State
         return State(
             self.curDay,
-            self.candList,
+            self.getCandidates(),
             self.lda,
             self.ndd,
             self.ldaTol,
             self.nddTol,
             self.nfd,
             self.predetermined,
-            self.overrideCons
+            self.overrideCons,
+            self.totals,
+            self.lazyCands,
+            self.arrays
         )
 
     def __eq__(self, other):
@@ -948,6 +1084,20 @@ class State:
         # Return the values of the current state
         return self.curDay, self.candList, self.lda, self.ndd, self.nfd
 
+    def getCandidates(self):
+        # Return the remaining candidate RAs in the order that they will be tried
+        if self.lazyCands:
+            return [entry[-1] for entry in sorted(self.candList)]
+
+        return self.candList
+
+    def getConflictCandidates(self):
+        # Return the remaining conflict candidate RAs in the order that they will be tried
+        if self.lazyCands:
+            return [entry[-1] for entry in sorted(self.conList)]
+
+        return self.conList
+
     def hasEmptyCandList(self):
         # Return a boolean denoting whether the candidate list is empty or not
         return len(self.candList) == 0
@@ -969,8 +1119,18 @@ class State:
         #  considered a double-day.
         return self.curDay.isDoubleDay()
 
+    def peekNextCandidate(self):
+        # Return the next duty candidate without removing it
+        if self.lazyCands:
+            return self.candList[0][-1]
+
+        return self.candList[0]
+
     def getNextCandidate(self):
         # Remove and return the next duty candidate
+        if self.lazyCands:
+            return heapq.heappop(self.candList)[-1]
+
         return self.candList.pop(0)
 
     def assignNextRA(self):
@@ -979,8 +1139,14 @@ class State:
         # Get the next candidate RA for the curDay's duty
         candRA = self.getNextCandidate()
 
+        # Check to see if the duty being assigned is flagged
+        isFlagged = self.curDay.nextDutySlotIsFlagged()
+
+        # Record the assignment so that it can be undone later
+        self.undoLog.append((candRA, self.lda[candRA], isFlagged))
+
         # If flagged duty, then update numFlagDuties
-        if self.curDay.nextDutySlotIsFlagged():
+        if isFlagged:
             self.nfd[candRA] += 1
 
         # Assign the candidate RA for the curDay's duty
@@ -993,60 +1159,133 @@ class State:
         if self.isDoubleDay():
             self.ndd[candRA] += 1
 
+        # Update the running totals if we are keeping them
+        if self.totals is not None:
+            self.totals.recordAssignment(self.curDay.getPoints(), self.isDoubleDay(), isFlagged)
+
+        # Update the scoring arrays if we are keeping them
+        if self.arrays is not None:
+            self.arrays.recordAssignment(
+                candRA, self.curDay.getDate(), self.curDay.getPoints(), self.isDoubleDay(), isFlagged
+            )
+
         # Return the selected candidate RA
         return candRA
 
     def getSortedWorkableRAs(self, raList, day, lastDateAssigned, isDoubleDay,
                              numDoubleDays, datePts, ldaTolerance, nddTolerance,
-                             numFlagDuties):
+                             numFlagDuties, runningTotals=None, scoringArrays=None):
         # Create and return a new sorted list of RAs that are available for duty
         #  on the provided day. Also create and return a new sorted list of RAs
         #  that are NOT available for duty on the provided day.
 
+        # Score the RAs that are and are not available for duty
+        retList, conList = self.getScoredWorkableRAs(
+            raList, day, lastDateAssigned, isDoubleDay, numDoubleDays, datePts,
+            ldaTolerance, nddTolerance, numFlagDuties, runningTotals, scoringArrays
+        )
+
+        # Sort the RAs from lowest candidate score to the highest. RAs with the
+        #  same score are kept in the order that they appear in the raList.
+        retList.sort()
+        conList.sort()
+
+        return [entry[-1] for entry in retList], [entry[-1] for entry in conList]
+
+    def getScoredWorkableRAs(self, raList, day, lastDateAssigned, isDoubleDay,
+                             numDoubleDays, datePts, ldaTolerance, nddTolerance,
+                             numFlagDuties, runningTotals=None, scoringArrays=None):
+        # Create and return a new list of (score, position, RA) entries for the RAs
+        #  that are available for duty on the provided day. Also create and return
+        #  a new list of entries for the RAs that are NOT available for duty on the
+        #  provided day. The position of the RA in the raList breaks ties between
+        #  equal scores so that the RAs themselves are never compared. The lists are
+        #  only sorted if they were scored with the provided scoringArrays.
+
         # Initialize the conflict list
         conList = []
 
-        # Calculate the average number of points amongst RAs
-        # Set the sum to 0
-        s = 0
-        # Iterate through all of the RAs and add up all of their points
-        for ra in raList:
-            s += ra.getPoints()
+        # If running totals have been provided, then use them to calculate
+        #  the averages rather than summing over all of the RAs.
+        if runningTotals is not None:
+            # Calculate the average number of points per RA
+            ptsAvg = runningTotals.getPointsAvg()
 
-        # Calculate the average number of points per RA
-        ptsAvg = s / len(raList)
+            # If isDoubleDay, calculate the average number of double-duty days
+            #  and flagged duties assigned amongst RAs.
+            if isDoubleDay:
+                doubleDayAvg = runningTotals.getDoubleDayAvg()
+                flagDutyAvg = runningTotals.getFlagDutyAvg()
 
-        # print("  Average Points:",ptsAvg)
+            else:
+                # Default to -1 when not a double-duty day
+                doubleDayAvg = -1
+                flagDutyAvg = -1
 
-        # If isDoubleDay, calculate the average number of double-duty days
-        #  assigned amongst RAs as well as the average number of flagged
-        #  duties assigned amongst RAs.
-        if isDoubleDay:
+        else:
+            # Calculate the average number of points amongst RAs
             # Set the sum to 0
             s = 0
-            # Iterate through all of the ras in the numDoubleDays Dictionary
-            for ra in numDoubleDays:
-                # Add up all of the number of double-duty days that have been assigned
-                s += numDoubleDays[ra]
+            # Iterate through all of the RAs and add up all of their points
+            for ra in raList:
+                s += ra.getPoints()
 
-            # Calculate the average number of double-days per RA
-            doubleDayAvg = s / len(numDoubleDays)
-            # print("  Double Day Average:",doubleDayAvg)
+            # Calculate the average number of points per RA
+            ptsAvg = s / len(raList)
 
-            # Set the sum to 0
-            s = 0
-            # Iterate through all of the RAs in the numFlagDuties Dictionary
-            for ra in numFlagDuties:
-                # Add upp all of the number of flagged duties that have been assigned
-                s += numFlagDuties[ra]
+            # print("  Average Points:",ptsAvg)
 
-            # Calculate the average number of flagged duties per RA
-            flagDutyAvg = s / len(numFlagDuties)
+            # If isDoubleDay, calculate the average number of double-duty days
+            #  assigned amongst RAs as well as the average number of flagged
+            #  duties assigned amongst RAs.
+            if isDoubleDay:
+                # Set the sum to 0
+                s = 0
+                # Iterate through all of the ras in the numDoubleDays Dictionary
+                for ra in numDoubleDays:
+                    # Add up all of the number of double-duty days that have been assigned
+                    s += numDoubleDays[ra]
+
+                # Calculate the average number of double-days per RA
+                doubleDayAvg = s / len(numDoubleDays)
+                # print("  Double Day Average:",doubleDayAvg)
+
+                # Set the sum to 0
+                s = 0
+                # Iterate through all of the RAs in the numFlagDuties Dictionary
+                for ra in numFlagDuties:
+                    # Add upp all of the number of flagged duties that have been assigned
+                    s += numFlagDuties[ra]
+
+                # Calculate the average number of flagged duties per RA
+                flagDutyAvg = s / len(numFlagDuties)
 
-        else:
-            # Default to -1 when not a double-duty day
-            doubleDayAvg = -1
-            flagDutyAvg = -1
+            else:
+                # Default to -1 when not a double-duty day
+                doubleDayAvg = -1
+                flagDutyAvg = -1
+
+        # The following values are the same for every RA, so they are only
+        #  looked up once rather than for each RA.
+        curDate = day.getDate()
+        isFlagged = isDoubleDay and day.nextDutySlotIsFlagged()
+
+        # If scoring arrays have been provided, then filter and score all of the
+        #  RAs at once using them.
+        if scoringArrays is not None:
+            candEntries, conEntries = scoringArrays.scoreWorkableRAs(
+                curDate, isDoubleDay, isFlagged, datePts, ldaTolerance,
+                nddTolerance, ptsAvg, doubleDayAvg, flagDutyAvg
+            )
+
+            # The scoring arrays score every RA that they were created with, so if
+            #  only some of those RAs were provided, then drop the entries of the rest.
+            if raList is not scoringArrays.raList:
+                providedRAs = set(raList)
+                candEntries = [entry for entry in candEntries if entry[-1] in providedRAs]
+                conEntries = [entry for entry in conEntries if entry[-1] in providedRAs]
+
+            return candEntries, conEntries
 
         # Initialize the list to be returned containing all workable RAs
         retList = []
@@ -1054,14 +1293,14 @@ class State:
         # print("  Removing candidates")
         # Iterate over the raList and get rid of the candidates who are not
         #  available for duty on this date.
-        for ra in raList:
+        for pos, ra in enumerate(raList):
             # print("    ",ra)
             # Start by assuming this RA is a duty candidate
             isCand = True
 
             # If an RA has a conflict with the duty shift
-            # print(day.getDate() in ra.getConflicts())
-            if day.getDate() in ra.getConflicts():
+            # print(ra.hasConflict(day.getDate()))
+            if ra.hasConflict(curDate):
                 # Then the RA is no longer a duty candidate
                 isCand = False
 
@@ -1070,8 +1309,8 @@ class State:
             # If an RA has been assigned a duty recently
             #  This is skipped when the LDA is 0, meaning the RA has not been
             #  assigned for duty yet this month.
-            if lastDateAssigned[ra] != 0 and \
-               day.getDate() - lastDateAssigned[ra] < ldaTolerance:
+            raLDA = lastDateAssigned[ra]
+            if raLDA != 0 and curDate - raLDA < ldaTolerance:
                 # Then the RA is no longer a duty candidate
                 isCand = False
                 # print("      Removed: Recent Duty")
@@ -1085,81 +1324,52 @@ class State:
                     isCand = False
                     # print("      Removed: Double Day Overload")
 
-            # If an RA meets the necessary criteria
-            if isCand:
-                # Then append them to the candidate list
-                retList.append(ra)
-                # print("      Valid Candidate")
-            else:
-                # Append the RA to the list of RAs that have
-                #  conflicts with this date.
-                conList.append(ra)
-
-        def genCandScore(ra, day, lastDateAssigned, numDoubleDays, isDoubleDay,
-                         datePts, doubleDayAvg, ptsAvg, numFlagDuties, flagDutyAvg):
-            # This function generates the candidate score of the RA
-            #  For simplicity's sake, all variables aside from 'ra' and 'day'
-            #  are values.
+            # Generate the candidate score of the RA
 
             # Base value is the number of points an RA has
-            weight = ra.getPoints()
+            raPts = ra.getPoints()
+            weight = raPts
 
             # Add the difference between the number of points an RA has and the
             #  average number of points for all the RAs. This value could be
             #  negative, in which case, it will push the ra further towards the front
-            weight += ra.getPoints() - ptsAvg
+            weight += raPts - ptsAvg
 
             # Subtract the number of days since the RA was last assigned
-            weight -= day.getDate() - lastDateAssigned
+            weight -= curDate - raLDA
 
             # If it is a double-duty day
             if isDoubleDay:
                 # Add the difference between the number of doubleDays an RA has
                 #  and the average number of doubleDays for all the RAs.
-                weight += numDoubleDays - doubleDayAvg
+                weight += numDoubleDays[ra] - doubleDayAvg
 
                 # If the next duty slot for the day will be a flagged duty slot,
-                if day.nextDutySlotIsFlagged():
+                if isFlagged:
                     # Add the difference between the number of flagged duties an RA has
                     #  and the average number of flag duties for all the RAs.
-                    weight += numFlagDuties - flagDutyAvg
+                    weight += numFlagDuties[ra] - flagDutyAvg
 
             # If the number of points from this day will throw the RA over
             #  the average...
-            if ra.getPoints() + datePts > ptsAvg:
+            if raPts + datePts > ptsAvg:
                 # ... then add the number of points over the average
-                weight += (ra.getPoints() + datePts) - ptsAvg
+                weight += (raPts + datePts) - ptsAvg
 
             else:
                 # Otherwise subtract the difference between the average and the
                 #  number of points the RA would have.
-                weight -= ptsAvg - (ra.getPoints() + datePts)
-
-            return weight
-
-        # Sort the RAs from lowest candidate score to the highest.
-        #  The following line sorts the retList using a lambda function as the
-        #  key. The purpose of this lambda function is to wrap genCandScore
-        #  so that it can be passed the necessary parameters that are within a
-        #  scope that is beyond genCandScore. Additionally, these parameters can
-        #  be recalculated for each RA that is passed to the lambda function.
-        # print("  Sorting")
-        retList.sort(
-            key=lambda ra: genCandScore(
-                ra, day, lastDateAssigned[ra],
-                numDoubleDays[ra], isDoubleDay, datePts,
-                doubleDayAvg, ptsAvg, numFlagDuties[ra],
-                flagDutyAvg
-            )
-        )
-        conList.sort(
-            key=lambda ra: genCandScore(
-                ra, day, lastDateAssigned[ra],
-                numDoubleDays[ra], isDoubleDay, datePts,
-                doubleDayAvg, ptsAvg, numFlagDuties[ra],
-                flagDutyAvg
-            )
-        )
+                weight -= ptsAvg - (raPts + datePts)
+
+            # If an RA meets the necessary criteria
+            if isCand:
+                # Then append them to the candidate list
+                retList.append((weight, pos, ra))
+                # print("      Valid Candidate")
+            else:
+                # Append the RA to the list of RAs that have
+                #  conflicts with this date.
+                conList.append((weight, pos, ra))
 
         return retList, conList
 
@@ -1189,13 +1399,64 @@ class State:
                     # Then also decrement the numFlagDuties
                     self.nfd[assignedRA] -= 1
 
+                # Revert the running totals if we are keeping them
+                if self.totals is not None:
+                    self.totals.revertAssignment(
+                        self.curDay.getPoints(), self.curDay.isDoubleDay(), dutySlot.getFlag()
+                    )
+
                 # Lastly, remove the RA from duty
                 self.curDay.removeRA(assignedRA)
 
             # If it is not assigned, skip this duty slot
 
+    def undoAssignments(self):
+        # Revert all of the assignments recorded in the undoLog. This restores the
+        #  lastDateAssigned, numDoubleDays and numFlagDuties dicts, as well as the
+        #  RAs' points, to the values they had before this state's assignments were
+        #  made. Unlike removeAssignedRAs, this does not require the dicts to be
+        #  copied for each state, so they may be shared across the entire search.
+
+        # Revert the assignments in the reverse order that they were made
+        while len(self.undoLog) > 0:
+            ra, prevLDA, wasFlagged = self.undoLog.pop()
+
+            # Remove the RA from duty. This also removes the Day's points.
+            self.curDay.removeRA(ra)
+
+            # Restore the RA's previous lastDateAssigned value
+            self.lda[ra] = prevLDA
+
+            # If this day is a doubleDay
+            if self.curDay.isDoubleDay():
+                # Then also decrement the numDoubleDays dict
+                self.ndd[ra] -= 1
+
+            # If the duty was flagged
+            if wasFlagged:
+                # Then also decrement the numFlagDuties dict
+                self.nfd[ra] -= 1
+
+            # Revert the running totals if we are keeping them
+            if self.totals is not None:
+                self.totals.revertAssignment(self.curDay.getPoints(), self.curDay.isDoubleDay(), wasFlagged)
+
+            # Revert the scoring arrays if we are keeping them
+            if self.arrays is not None:
+                self.arrays.revertAssignment(
+                    ra, prevLDA, self.curDay.getPoints(), self.curDay.isDoubleDay(), wasFlagged
+                )
+
+    def hasUndoableAssignments(self):
+        # Return a boolean denoting whether there are assignments on this state
+        #  that can be reverted with undoAssignments.
+        return len(self.undoLog) > 0
+
     def getNextConflictCandidate(self):
         # Remove and return the next conflict candidate
+        if self.lazyCands:
+            return heapq.heappop(self.conList)[-1]
+
         return self.conList.pop(0)
 
     def assignNextConflictRA(self):
@@ -1205,8 +1466,11 @@ class State:
         # Get the next conflict RA for the curDay's duty
         conRA = self.getNextConflictCandidate()
 
+        # Check to see if the duty being assigned is flagged
+        isFlagged = self.curDay.nextDutySlotIsFlagged()
+
         # If flagged duty, then update numFlagDuties
-        if self.curDay.nextDutySlotIsFlagged():
+        if isFlagged:
             self.nfd[conRA] += 1
 
         # Assign the conflict RA for the curDay's duty
@@ -1219,14 +1483,21 @@ class State:
         if self.isDoubleDay():
             self.ndd[conRA] += 1
 
+        # Update the running totals if we are keeping them
+        if self.totals is not None:
+            self.totals.recordAssignment(self.curDay.getPoints(), self.isDoubleDay(), isFlagged)
+
         # Return the selected candidate RA
         return conRA
 
     def assignRA(self, ra):
         # Assign the provided RA for duty on this day.
 
+        # Check to see if the duty being assigned is flagged
+        isFlagged = self.curDay.nextDutySlotIsFlagged()
+
         # If flagged duty, then update numFlagDuties
-        if self.curDay.nextDutySlotIsFlagged():
+        if isFlagged:
             self.nfd[ra] += 1
 
         # Assign the candidate RA for the curDay's duty
@@ -1239,9 +1510,227 @@ class State:
         if self.isDoubleDay():
             self.ndd[ra] += 1
 
+        # Update the running totals if we are keeping them
+        if self.totals is not None:
+            self.totals.recordAssignment(self.curDay.getPoints(), self.isDoubleDay(), isFlagged)
+
         # Return the selected candidate RA
         return ra
 
+    # ------------------------
+    # -- Supporting Classes --
+    # ------------------------
+    class RunningTotals:
+        """ Object for keeping running totals of the duties assigned during the Scheduler's DFS traversal.
+
+            This class is intended to be shared by all of the State objects of a traversal so that the
+            average number of points, double-day duties and flagged duties amongst the RAs can be
+            calculated without summing over every RA for each State.
+
+            Args:
+                raList          (lst):     A list containing the RA objects that are being scheduled.
+                numDoubleDays   (dict):    A dictionary containing the number of double days each of
+                                            the RAs has already been assigned.
+                numFlagDuties   (dict):    A dictionary containing the number of flagged duties each
+                                            of the RAs has already been assigned.
+        """
+
+        def __init__(self, raList, numDoubleDays, numFlagDuties):
+            # The number of RAs that are being scheduled
+            self.numRAs = len(raList)
+
+            # The total number of points amongst the RAs
+            self.ptsTotal = sum(ra.getPoints() for ra in raList)
+
+            # The number of RAs and total number of double-day duties in the numDoubleDays dict
+            self.nddCount = len(numDoubleDays)
+            self.nddTotal = sum(numDoubleDays.values())
+
+            # The number of RAs and total number of flagged duties in the numFlagDuties dict
+            self.nfdCount = len(numFlagDuties)
+            self.nfdTotal = sum(numFlagDuties.values())
+
+        def __repr__(self):
+            return "<RunningTotals pts:{}, ndd:{}, nfd:{}>".format(self.ptsTotal, self.nddTotal, self.nfdTotal)
+
+        def copy(self):
+            # Return a new RunningTotals object with all of the same values as this one
+            cp = State.RunningTotals([], {}, {})
+            cp.numRAs = self.numRAs
+            cp.ptsTotal = self.ptsTotal
+            cp.nddCount = self.nddCount
+            cp.nddTotal = self.nddTotal
+            cp.nfdCount = self.nfdCount
+            cp.nfdTotal = self.nfdTotal
+            return cp
+
+        def recordAssignment(self, pts, isDoubleDay, isFlagged):
+            # Update the totals for an RA being assigned a duty worth the
+            #  provided number of points.
+            self.ptsTotal += pts
+
+            if isDoubleDay:
+                self.nddTotal += 1
+
+            if isFlagged:
+                self.nfdTotal += 1
+
+        def revertAssignment(self, pts, isDoubleDay, isFlagged):
+            # Update the totals for an RA being removed from a duty worth the
+            #  provided number of points.
+            self.ptsTotal -= pts
+
+            if isDoubleDay:
+                self.nddTotal -= 1
+
+            if isFlagged:
+                self.nfdTotal -= 1
+
+        def getPointsAvg(self):
+            # Return the average number of points per RA
+            return self.ptsTotal / self.numRAs
+
+        def getDoubleDayAvg(self):
+            # Return the average number of double-day duties per RA
+            return self.nddTotal / self.nddCount
+
+        def getFlagDutyAvg(self):
+            # Return the average number of flagged duties per RA
+            return self.nfdTotal / self.nfdCount
+
+    class ScoringArrays:
+        """ Object for scoring all of the duty candidates of a State at once using NumPy arrays.
+
+            This class is intended to be shared by all of the State objects of a traversal that
+            keeps integer lastDateAssigned values (such as the undo trail). Each RA's points, last
+            date assigned, number of double-day duties and number of flagged duties are kept in
+            arrays indexed by the RA's position in the raList so that filtering and scoring the
+            candidates for a day takes a handful of array operations rather than a loop over the
+            RAs. This class requires NumPy.
+
+            Args:
+                raList              (lst):     A list containing the RA objects that are being
+                                                scheduled.
+                lastDateAssigned    (dict):    A dictionary containing the last day each of the
+                                                RAs were assigned to duty.
+                numDoubleDays       (dict):    A dictionary containing the number of double days
+                                                each of the RAs has already been assigned.
+                numFlagDuties       (dict):    A dictionary containing the number of flagged
+                                                duties each of the RAs has already been assigned.
+                lastDate            (int):     An integer denoting the last day of the month that
+                                                will be scored.
+        """
+
+        def __init__(self, raList, lastDateAssigned, numDoubleDays, numFlagDuties, lastDate):
+            # The RAs that are being scheduled
+            self.raList = raList
+
+            # The position of each RA in the raList
+            self.positions = {ra: pos for pos, ra in enumerate(raList)}
+
+            # The points, last date assigned, number of double-day duties and number
+            #  of flagged duties of each RA.
+            self.pts = np.array([ra.getPoints() for ra in raList], dtype=np.float64)
+            self.lda = np.array([lastDateAssigned[ra] for ra in raList], dtype=np.int64)
+            self.ndd = np.array([numDoubleDays[ra] for ra in raList], dtype=np.int64)
+            self.nfd = np.array([numFlagDuties[ra] for ra in raList], dtype=np.int64)
+
+            # A matrix where the entry at [i, d] is True if the 'i'th RA has a
+            #  conflict on the 'd'th day of the month.
+            self.conflicts = np.array(
+                [[(ra.getConflictMask() >> d) & 1 == 1 for d in range(lastDate + 1)] for ra in raList],
+                dtype=bool
+            ).reshape(len(raList), lastDate + 1)
+
+        def __repr__(self):
+            return "<ScoringArrays ras:{}>".format(len(self.raList))
+
+        @staticmethod
+        def isSupported():
+            # Return whether NumPy is available so that ScoringArrays can be used
+            return np is not None
+
+        def copy(self):
+            # Return a new ScoringArrays object with copies of this one's arrays
+            cp = State.ScoringArrays([], {}, {}, {}, 0)
+            cp.raList = self.raList
+            cp.positions = self.positions
+            cp.pts = self.pts.copy()
+            cp.lda = self.lda.copy()
+            cp.ndd = self.ndd.copy()
+            cp.nfd = self.nfd.copy()
+            cp.conflicts = self.conflicts
+            return cp
+
+        def recordAssignment(self, ra, date, pts, isDoubleDay, isFlagged):
+            # Update the arrays for the provided RA being assigned a duty on the
+            #  provided date worth the provided number of points.
+            pos = self.positions[ra]
+
+            self.pts[pos] += pts
+            self.lda[pos] = date
+
+            if isDoubleDay:
+                self.ndd[pos] += 1
+
+            if isFlagged:
+                self.nfd[pos] += 1
+
+        def revertAssignment(self, ra, prevLDA, pts, isDoubleDay, isFlagged):
+            # Update the arrays for the provided RA being removed from a duty worth
+            #  the provided number of points.
+            pos = self.positions[ra]
+
+            self.pts[pos] -= pts
+            self.lda[pos] = prevLDA
+
+            if isDoubleDay:
+                self.ndd[pos] -= 1
+
+            if isFlagged:
+                self.nfd[pos] -= 1
+
+        def scoreWorkableRAs(self, date, isDoubleDay, isFlagged, datePts, ldaTolerance,
+                             nddTolerance, ptsAvg, doubleDayAvg, flagDutyAvg):
+            # Create and return a sorted list of (score, position, RA) entries for the
+            #  RAs that are available for duty on the provided date, as well as a sorted
+            #  list of entries for the RAs that are NOT available. This filters and scores
+            #  the RAs exactly as State.getScoredWorkableRAs does, and the arithmetic is
+            #  done in the same order so that the scores are identical.
+
+            # An RA is not a candidate if they have a conflict with the duty shift or
+            #  if they have been assigned a duty recently.
+            isCand = ~self.conflicts[:, date] & ~((self.lda != 0) & (date - self.lda < ldaTolerance))
+
+            # If it is a double duty day, then an RA is also not a candidate if they have
+            #  been assigned more double-duty days than the nddTolerance over the average.
+            if isDoubleDay:
+                isCand &= ~(self.ndd > ((1 + nddTolerance) * doubleDayAvg))
+
+            # Generate the candidate score of every RA
+            weight = self.pts.copy()
+            weight += self.pts - ptsAvg
+            weight -= date - self.lda
+
+            if isDoubleDay:
+                weight += self.ndd - doubleDayAvg
+
+                if isFlagged:
+                    weight += self.nfd - flagDutyAvg
+
+            newPts = self.pts + datePts
+            weight = np.where(newPts > ptsAvg, weight + (newPts - ptsAvg), weight - (ptsAvg - newPts))
+
+            def createEntries(positions):
+                # Sort the provided positions from the lowest candidate score to the
+                #  highest and return them as (score, position, RA) entries. The sort
+                #  is stable so that RAs with the same score stay in raList order.
+                positions = positions[np.argsort(weight[positions], kind="stable")].tolist()
+
+                return list(zip(weight[positions].tolist(), positions, [self.raList[pos] for pos in positions]))
+
+            return createEntries(np.flatnonzero(isCand)), createEntries(np.flatnonzero(~isCand))
+
 
 if __name__ == "__main__":
 
@@ -398,11 +398,14 @@ def queueScheduler():
     # Create a DB cursor
     cur = ag.conn.cursor()
 
-    # Add a record in the scheduler_queue table for this request
+    # Add a record in the scheduler_queue table for this request. The month and
+    #  year are recorded so that the scheduler process can skip older requests
+    #  for the same month that are still waiting to be run.
     cur.execute(
-        """INSERT INTO scheduler_queue (res_hall_id, created_ra_id, created_date) VALUES (%s, %s, NOW()) 
+        """INSERT INTO scheduler_queue (res_hall_id, created_ra_id, created_date, month_num, year)
+        VALUES (%s, %s, NOW(), %s, %s) 
         RETURNING id, created_date, status;""",
-        (hallId, authedUser.ra_id())
+        (hallId, authedUser.ra_id(), monthNum, year)
     )
 
     # Commit the changes to the DB
@@ -433,6 +436,17 @@ def queueScheduler():
     if not schedulerQueueConn.publishMsg(msgBody, {"sqid": sqid}):
         # If the channel gave us an error, then re-establish the RabbitMQ connection.
 
+        # Mark the scheduler_queue record as failed since the scheduler process will
+        #  never receive the request. Otherwise the record would stay pending and
+        #  older requests for the same month would be skipped in favor of it.
+        cur = ag.conn.cursor()
+        cur.execute(
+            "UPDATE scheduler_queue SET status = %s, reason = %s WHERE id = %s;",
+            (-2, "Unable to queue scheduler request.", sqid)
+        )
+        ag.conn.commit()
+        cur.close()
+
         # Notify the user to try again
         return packageReturnObject(stdRet(-1, "Connection to message broker interrupted. Please try again."))
 
@@ -552,8 +566,14 @@ def getScheduleQueueItemInfo(sqid=None, resHallID=None):
     #        "reason": <scheduler_queue.reason>,
     #        "requestDatetime": <scheduler_queue.created_date>,
     #        "requestingRA": <ra.first_name> <ra.last_name>,
-    #        "sqid": <scheduler_queue.id>
+    #        "sqid": <scheduler_queue.id>,
+    #        "stats": <scheduler_queue.stats>
     #     }
+    #
+    #  The stats are NULL until the scheduler has processed the request. Afterwards,
+    #  they contain the number of LDAT attempts, the time spent loading inputs from
+    #  the DB, searching and saving the schedule, and the search statistics such as
+    #  the number of states pushed and popped, backtracks and max depth reached.
 
     # Assume this API was called from the server and verify that this is true.
     fromServer = True
@@ -603,7 +623,8 @@ def getScheduleQueueItemInfo(sqid=None, resHallID=None):
 
     # Fetch the desired information of the provided scheduler queue record.
     cur.execute("""
-        SELECT sq.status, sq.reason, sq.created_date, CONCAT(ra.first_name,' ',ra.last_name), sq.id
+        SELECT sq.status, sq.reason, sq.created_date, CONCAT(ra.first_name,' ',ra.last_name), sq.id,
+               sq.stats
         FROM scheduler_queue AS sq JOIN ra ON (ra.id = sq.created_ra_id)
         WHERE sq.id = %s
         AND sq.res_hall_id = %s
@@ -623,7 +644,8 @@ def getScheduleQueueItemInfo(sqid=None, resHallID=None):
             "reason": res[1],
             "requestDatetime": res[2] if fromServer else res[2].strftime('%Y-%m-%dT%H:%M:%S%z'),
             "requestingRA": res[3],
-            "sqid": res[4]
+            "sqid": res[4],
+            "stats": res[5]
         }
 
     else:
@@ -633,7 +655,8 @@ def getScheduleQueueItemInfo(sqid=None, resHallID=None):
             "reason": "Record Not Found - {}".format(sqid),
             "requestDatetime": None,
             "requestingRA": None,
-            "sqid": 0
+            "sqid": 0,
+            "stats": None
         }
 
     # Close the cursor
@@ -875,6 +898,11 @@ def alterDuty():
         # Notify the user and stop processing
         return packageReturnObject(stdRet(0, "Unable to validate schedule."))
 
+    # Clear the schedule's fingerprint since it will no longer match what the
+    #  scheduler generated. This prevents the edited schedule from being
+    #  reused by the scheduler's result cache.
+    cur.execute("UPDATE schedule SET fingerprint = NULL WHERE id = %s;", (schedId[0],))
+
     # Execute an UPDATE statement to alter the duty in the DB
     cur.execute("""UPDATE duties
                    SET ra_id = %s,
@@ -1035,6 +1063,11 @@ def addNewDuty():
     else:
 
         try:
+            # Clear the schedule's fingerprint since it will no longer match what the
+            #  scheduler generated. This prevents the edited schedule from being
+            #  reused by the scheduler's result cache.
+            cur.execute("UPDATE schedule SET fingerprint = NULL WHERE id = %s;", (schedId[0],))
+
             # Execute an INSERT statement to have the duty created in the duties table
             cur.execute("""INSERT INTO duties (hall_id, ra_id, day_id, sched_id, point_val, flagged)
                             VALUES (%s, %s, %s, %s, %s, %s);""",
@@ -1186,6 +1219,11 @@ def deleteDuty():
         # Notify the user and stop processing
         return packageReturnObject(stdRet(0, "Unable to validate schedule."))
 
+    # Clear the schedule's fingerprint since it will no longer match what the
+    #  scheduler generated. This prevents the edited schedule from being
+    #  reused by the scheduler's result cache.
+    cur.execute("UPDATE schedule SET fingerprint = NULL WHERE id = %s;", (schedId[0],))
+
     # Execute DELETE statement to remove the provided duty from the DB
     cur.execute("""DELETE FROM duties
                     WHERE ra_id = %s
@@ -1,14 +1,19 @@
 from schedule.ra_sched import Schedule, Day, RA, State
 from calendar import Calendar
 from pythonds import Stack
+from collections import OrderedDict
 import logging
+import random
 import time
 
 
 def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts=2,
              doubleNum=2, doubleDates=None, doubleDateNum=2, doubleDatePts=1,
              ldaTolerance=8, nddTolerance=.1, prevDuties=None, breakDuties=None,
-             setDDFlag=False, regDutyPts=1, regNumAssigned=1, timeout=5):
+             setDDFlag=False, regDutyPts=1, regNumAssigned=1, timeout=5, useUndoTrail=False,
+             seed=None, useForwardChecking=False, useBackjumping=False, nogoodCacheSize=0,
+             useVectorizedScoring=False, useSymmetryBreaking=False, useSlotCombinations=False,
+             useAnytimeScheduling=False, nodeBudget=0, timeoutCheckInterval=1):
     # This algorithm will schedule RAs for duties based on ...
     #
     # The algorithm returns a Schedule object that contains Day objects which, in
@@ -54,6 +59,70 @@ def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts
     #                      previously scheduled break duty on that date.
     #     setDDFlag     = boolean representing whether or not to set the special
     #                      flag on one of the duties for double duty days.
+    #     timeout       = number of seconds the search may run before giving up.
+    #                      If None, the search is only limited by the nodeBudget.
+    #     useUndoTrail  = boolean representing whether or not the search should
+    #                      share a single set of lastDateAssigned, numDoubleDays
+    #                      and numFlagDuties dicts across all states and revert
+    #                      assignments in place when backtracking rather than
+    #                      deep copying each state.
+    #     seed          = integer used to shuffle the order of the raList before
+    #                      scheduling. Since the candidate lists are sorted with a
+    #                      stable sort, this changes how RAs with equal candidate
+    #                      scores are ordered. Runs with the same seed and inputs
+    #                      produce the same schedule. If None, the raList is used
+    #                      in the order it was provided.
+    #     useForwardChecking = boolean representing whether or not the search
+    #                      should assign the most constrained duty slot first
+    #                      and remove assigned RAs from the candidates of the
+    #                      nearby duty slots, backtracking as soon as any duty
+    #                      slot is left without candidates. When set, the
+    #                      useUndoTrail parameter is ignored along with the
+    #                      nogoodCacheSize, useVectorizedScoring,
+    #                      useSymmetryBreaking and useSlotCombinations
+    #                      parameters since they only apply to the undo trail.
+    #     useBackjumping = boolean representing whether or not the search should
+    #                      jump straight back to the assignment that caused a
+    #                      duty slot to run out of candidates rather than
+    #                      backtracking one duty slot at a time. This uses the
+    #                      same search as useForwardChecking.
+    #     nogoodCacheSize = maximum number of states proven to have no solution
+    #                      that should be remembered so that equivalent states
+    #                      can be skipped. This is only used with useUndoTrail
+    #                      and a value of 0 disables the cache.
+    #     useVectorizedScoring = boolean representing whether or not the duty
+    #                      candidates should be filtered and scored using NumPy
+    #                      arrays rather than one RA at a time. This is only used
+    #                      with useUndoTrail and is ignored if NumPy is not
+    #                      installed.
+    #     useSymmetryBreaking = boolean representing whether or not the search
+    #                      should skip a candidate RA for a duty slot when an
+    #                      interchangeable RA has already been tried for that
+    #                      duty slot and failed. This is only used with
+    #                      useUndoTrail.
+    #     useSlotCombinations = boolean representing whether or not the search
+    #                      should fill the duty slots of a date with multiple
+    #                      duties as a single combination of RAs rather than
+    #                      trying every ordering of the same RAs. If setDDFlag
+    #                      is True, the flagged duty for each date is given to
+    #                      the RA with the fewest flagged duties once the
+    #                      schedule has been generated. This is only used with
+    #                      useUndoTrail.
+    #     useAnytimeScheduling = boolean representing whether or not a partial
+    #                      schedule should be returned when the search times out
+    #                      or cannot find a complete schedule. The partial schedule
+    #                      keeps the deepest assignment the search reached and
+    #                      fills what it can of the remaining duty slots. The
+    #                      dates that are left unfilled are listed in its notes
+    #                      and it has a status of WARNING.
+    #     nodeBudget    = maximum number of nodes the search may visit before
+    #                      giving up. Unlike the timeout, this does not depend on
+    #                      how busy the machine is, so runs with the same inputs
+    #                      and budget always produce the same result. A value of
+    #                      0 disables the budget.
+    #     timeoutCheckInterval = number of nodes the search visits between checks
+    #                      of the timeout. The clock is only read on every
+    #                      timeoutCheckInterval-th node rather than on every node.
 
     # Mutable arguments are set to None by default. Override None values
     noDutyDates = list() if noDutyDates is None else noDutyDates
@@ -61,61 +130,556 @@ def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts
     prevDuties = list() if prevDuties is None else prevDuties
     breakDuties = list() if breakDuties is None else breakDuties
 
+    # The timeout is checked at least once every node
+    timeoutCheckInterval = max(1, timeoutCheckInterval)
+
+    # If a seed was provided, then shuffle a copy of the raList using the seed
+    if seed is not None:
+        raList = list(raList)
+        random.Random(seed).shuffle(raList)
+
     logging.info("Starting Scheduling Process")
 
-    def checkTooManyConflictsForSingleDay(raList, cal):
+    # Statistics describing the search that are attached to the returned schedule
+    searchStats = {
+        "nodes": 0,                     # The number of nodes the search visited
+        "statesPushed": 0,              # The number of states pushed onto the stack
+        "statesPopped": 0,              # The number of states popped off of the stack
+        "assignments": 0,               # The number of times an RA was assigned to a duty slot
+        "backtracks": 0,                # The number of assignments that were undone
+        "maxDepth": 0,                  # The greatest number of duty slots assigned at once
+        "candidateEvaluations": 0,      # The number of RAs scored as candidates for a duty slot
+        "setupSeconds": 0,              # The time spent creating the calendar and checking the inputs
+        "searchSeconds": 0,             # The time spent searching for a schedule
+        "budgetExhausted": 0            # 1 if the search ran out of time or nodes before finishing
+    }
+
+    # The time at which this function was called and at which the search began
+    setupStart = time.time()
+    searchStart = None
+
+    def addSearchStats(sched):
+        # Record the time spent on setup and searching and add the search
+        #  statistics to the provided schedule
+        now = time.time()
+
+        if searchStart is None:
+            searchStats["setupSeconds"] = round(now - setupStart, 4)
+
+        else:
+            searchStats["setupSeconds"] = round(searchStart - setupStart, 4)
+            searchStats["searchSeconds"] = round(now - searchStart, 4)
+
+        sched.addStats(searchStats)
+
+        return sched
+
+    def createAvailabilityMasks(raList, dutySlots):
+        # Create and return a dictionary that maps each date in the calendar to a
+        #  bitmask of the RAs who are available for duty on that date. Bit 'i' of
+        #  the mask is set if the RA at position 'i' of the raList does NOT have a
+        #  conflict on the given date.
+
+        # Create a mask with a bit set for every RA in the list
+        allRAsMask = (1 << len(raList)) - 1
+
+        availMasks = {}
+        # Iterate over the duty slots in the calendar
+        for day in dutySlots:
+            d = day.getDate()
+
+            # Skip dates we have already seen
+            if d in availMasks:
+                continue
+
+            # Set the bits for each of the RAs that have a conflict on this date
+            conMask = 0
+            for i, ra in enumerate(raList):
+                if ra.hasConflict(d):
+                    conMask |= 1 << i
+
+            # Save the RAs who are available on this date
+            availMasks[d] = allRAsMask & ~conMask
+
+        return availMasks
+
+    def countDutySlots(dutySlots):
+        # Create and return a dictionary that maps each date in the calendar to
+        #  the number of duty slots that need to be filled on that date.
+        slotCountDict = {}
+        for day in dutySlots:
+            slotCountDict[day.getDate()] = slotCountDict.get(day.getDate(), 0) + 1
+
+        return slotCountDict
+
+    def checkTooManyConflictsForSingleDay(dutySlots, availMasks):
         # Check to ensure that there is not a day of the month where too many
         #  RAs have submitted conflicts for. If there is such a day, return
 
         # Keep track of the days that have too many conflicts to be scheduled.
         res = []
 
-        conCountDict = {}
-        # Iterate over the RAs in the RA List
-        for ra in raList:
-            # Iterate over the RAs conflicts
-            for con in ra.getConflicts():
-                # If the conflict date has already been seen
-                if con in conCountDict.keys():
-                    # Increment the conflict's count
-                    conCountDict[con] += 1
-                else:
-                    # Set the conflict's count to 1
-                    conCountDict[con] = 1
-
-        # Iterate over the calendar
-        for day in cal:
-            # Ignore days that don't have conflicts
-            if day.getDate() in conCountDict.keys():
-                # If, after all the conflicts, there are not enough RAs
-                #  to fill all of the duty slots for the day.
-                if len(raList) - conCountDict[day.getDate()] < day.numberDutySlots():
-                    # Then add the day to the results.
-                    res.append(day)
+        # Count the number of duty slots that need to be filled on each date
+        slotCountDict = countDutySlots(dutySlots)
+
+        # Iterate over the dates in the calendar
+        for d in sorted(slotCountDict.keys()):
+            # If, after all the conflicts, there are not enough RAs
+            #  to fill all of the duty slots for the day.
+            if bin(availMasks[d]).count("1") < slotCountDict[d]:
+                # Then add the day to the results.
+                res.append(d)
 
         return res
 
-    def createDateDict(year, month, noDutyDates, doubleDays, doublePts, doubleNum,
-                       doubleDates, doubleDateNum, doubleDatePts, breakDuties,
-                       setDDFlag):
-        # Create and return the dictionary that describes how to get from one day
-        #  to another. The keys are the numeric date of a given day and the value
-        #  is the numeric date of the day that should follow the given day. The
-        #  first "day" in the dictionary is always 0 and the last key will have the
-        #  value of -1 to delineate that there are no more days in the chain.
-        #  An example can be seen below.
-
-        #     dateDict = { 0: 1, 1: 2, 2: 3, 3: 3.1, 3.1: 4, 4: -1 }
-
-        # In the above example, the start day is 0 which points to day 1 which in
-        #  turn points to day 2, which points to day 3. Day 3 has two duties that
-        #  need to be assigned which is why key 3 points to 3.1 and key 3.1 points
-        #  to key 4. To the algorithm, the fact that Day 3 has two duties does not
-        #  matter, but this convention allows the date dictionary to be more human
-        #  readable.
-
-        dateDict = {}
-        prevDay = Day(0, -1)
+    def createWorkableMasks(raList, availMasks, lastDateAssigned, ldaTolerance):
+        # Create and return a dictionary that maps each date in the calendar to a
+        #  bitmask of the RAs who can work on that date. This is the availMasks
+        #  with the RAs who are still within the ldaTolerance of a duty from the
+        #  previous month removed from the dates they cannot work.
+        workableMasks = {}
+        for d, mask in availMasks.items():
+            for i, ra in enumerate(raList):
+                if lastDateAssigned[ra] != 0 and d - lastDateAssigned[ra] < ldaTolerance:
+                    mask &= ~(1 << i)
+
+            workableMasks[d] = mask
+
+        return workableMasks
+
+    def findSlotCoverageBottleneck(dutySlots, raList, availMasks, lastDateAssigned, ldaTolerance):
+        # Check to ensure that the duty slots can be covered given the RAs'
+        #  conflicts and the ldaTolerance. Since an RA cannot be assigned more
+        #  than one duty within any window of ldaTolerance consecutive dates,
+        #  every such window must have a matching between its duty slots and
+        #  the RAs who are available for them. If a window does not, then no
+        #  schedule can be generated and there is no need to search for one.
+        #
+        #  By Hall's theorem, if a duty slot cannot be matched, then the slots
+        #  reached while searching for a match need more RAs than are available
+        #  to them. The sorted list of the dates of these slots is returned. If
+        #  every window can be matched, an empty list is returned.
+
+        slotCountDict = countDutySlots(dutySlots)
+        dates = sorted(slotCountDict.keys())
+
+        # Determine which RAs can work each date
+        windowMasks = createWorkableMasks(raList, availMasks, lastDateAssigned, ldaTolerance)
+
+        # Iterate over each window of ldaTolerance dates. Only windows that start
+        #  on a date with duty slots need to be checked since any other window's
+        #  slots are contained in the window starting at its next duty date.
+        for startIdx, start in enumerate(dates):
+            # Gather the dates of the duty slots within this window
+            windowSlots = []
+            for d in dates[startIdx:]:
+                if d >= start + ldaTolerance:
+                    break
+
+                windowSlots.extend([d] * slotCountDict[d])
+
+            # Map the index of each matched RA to the index of its duty slot
+            slotForRA = {}
+
+            def findAugmentingPath(slotIdx, visited):
+                # Try to match the duty slot with an available RA, moving RAs who
+                #  are already matched to other slots if necessary. The 'visited'
+                #  list holds a bitmask of the RAs that have been tried.
+                candidates = windowMasks[windowSlots[slotIdx]]
+                while candidates:
+                    # Take the lowest available RA from the candidates
+                    bit = candidates & -candidates
+                    candidates ^= bit
+
+                    # Skip RAs that have already been tried during this search
+                    if visited[0] & bit:
+                        continue
+
+                    visited[0] |= bit
+                    raIdx = bit.bit_length() - 1
+
+                    # If the RA is not matched, or the slot they are matched to can
+                    #  be matched with someone else, then match the RA with this slot
+                    if raIdx not in slotForRA or findAugmentingPath(slotForRA[raIdx], visited):
+                        slotForRA[raIdx] = slotIdx
+                        return True
+
+                return False
+
+            for slotIdx in range(len(windowSlots)):
+                visited = [0]
+                if not findAugmentingPath(slotIdx, visited):
+                    # The slots reached during the search are this slot and the
+                    #  slots matched to every RA that was tried.
+                    bottleneckSlots = [slotIdx] + [
+                        slotForRA[raIdx] for raIdx in range(len(raList)) if visited[0] & (1 << raIdx)
+                    ]
+
+                    return sorted(set(windowSlots[i] for i in bottleneckSlots))
+
+        return []
+
+    def searchBudgetExhausted(nodes, startTime, timeout, nodeBudget, timeoutCheckInterval):
+        # Return whether a search that has visited the provided number of nodes
+        #  should give up. This is the case if it has visited more than the
+        #  nodeBudget or if it has run longer than the timeout. The timeout is
+        #  only checked on every timeoutCheckInterval-th node so that the clock
+        #  is not read on every node. A nodeBudget of 0 or a timeout of None
+        #  disables the respective limit.
+        if 0 < nodeBudget < nodes:
+            return True
+
+        return timeout is not None and nodes % timeoutCheckInterval == 0 and time.time() - startTime > timeout
+
+    def searchWithForwardChecking(slots, raList, availMasks, lastDateAssigned, numDoubleDays,
+                                  numFlagDuties, ldaTolerance, nddTolerance, startTime, timeout,
+                                  useBackjumping=False, stats=None, nodeBudget=0, timeoutCheckInterval=1,
+                                  bestAssignment=None):
+        # Assign an RA to every duty slot in the calendar using a depth first
+        #  search that does not walk the duty slots in calendar order. Instead,
+        #  each duty slot keeps a domain of the RAs who can still be assigned to
+        #  it. Whenever an RA is assigned, they are removed from the domains of
+        #  the duty slots within the ldaTolerance of the assigned date (forward
+        #  checking). If this leaves a duty slot with no RAs, the assignment is
+        #  abandoned immediately rather than when the search reaches that slot.
+        #  The search always branches on the unassigned duty slot with the fewest
+        #  RAs left in its domain (most constrained first).
+        #
+        #  The search also records why each duty slot ran out of candidates: the
+        #  earlier assignments that removed RAs from its domain through the
+        #  ldaTolerance or, if RAs were pushed over the nddTolerance, all of
+        #  the earlier assignments. If useBackjumping is True, then when a duty slot runs
+        #  out of candidates, the search jumps straight back to the most recent
+        #  of those assignments rather than trying the remaining candidates of
+        #  every duty slot assigned in between (conflict-directed backjumping).
+        #
+        #  The RAs are assigned to the Day objects in the slots list and the
+        #  numDoubleDays and numFlagDuties dicts are updated as the search runs.
+        #
+        #  If a stats dict is provided, then the number of search nodes visited,
+        #  entered and abandoned, assignments, undone assignments, the greatest
+        #  number of duty slots assigned at once and the number of RAs scored are
+        #  added to its nodes, statesPushed, statesPopped, assignments,
+        #  backtracks, maxDepth and candidateEvaluations entries.
+        #
+        #  If a bestAssignment list is provided, then whenever the search assigns
+        #  more duty slots at once than it has before, the list is replaced with
+        #  the RA assigned to each duty slot, or None for the duty slots that were
+        #  not assigned.
+        #
+        #  The search gives up once it visits more than nodeBudget nodes or runs
+        #  longer than the timeout, which is checked every timeoutCheckInterval
+        #  nodes.
+        #
+        #  This function returns True if every duty slot was assigned, False if
+        #  no schedule could be generated, or None if the node budget or timeout
+        #  was reached.
+
+        # Create the domain of RAs for each duty slot as a bitmask
+        workableMasks = createWorkableMasks(raList, availMasks, lastDateAssigned, ldaTolerance)
+        domains = [workableMasks[day.getDate()] for day in slots]
+
+        # For each duty slot, find the other duty slots that the same RA cannot
+        #  also be assigned to because they are within the ldaTolerance
+        neighbors = [
+            [t for t in range(len(slots)) if t != s and abs(slots[t].getDate() - slots[s].getDate()) < ldaTolerance]
+            for s in range(len(slots))
+        ]
+
+        # The index of the RA assigned to each duty slot
+        assignedRA = [None] * len(slots)
+
+        # The dates that each RA has been assigned during this search
+        assignedDates = [[] for _ in raList]
+
+        # The duty slots whose assignments removed RAs from each duty slot's domain
+        prunedBy = [[] for _ in slots]
+
+        # Keep running totals so that the averages are cheap to calculate
+        totals = State.RunningTotals(raList, numDoubleDays, numFlagDuties)
+
+        # If no stats dict was provided, then keep the statistics in a throwaway dict
+        if stats is None:
+            stats = {"nodes": 0, "statesPushed": 0, "statesPopped": 0, "assignments": 0, "backtracks": 0,
+                     "maxDepth": 0, "candidateEvaluations": 0}
+
+        def assignSlot(s, r):
+            # Assign the RA at index 'r' to the duty slot at index 's' and remove
+            #  them from the domains of the neighboring duty slots.
+            #
+            #  This returns a tuple containing the list of duty slots that were
+            #  pruned, whether the duty was flagged and whether any of the
+            #  pruned duty slots were left without any RAs.
+            ra = raList[r]
+            day = slots[s]
+
+            isFlagged = day.nextDutySlotIsFlagged()
+            day.addRA(ra)
+            totals.recordAssignment(day.getPoints(), day.isDoubleDay(), isFlagged)
+
+            if day.isDoubleDay():
+                numDoubleDays[ra] += 1
+
+                if isFlagged:
+                    numFlagDuties[ra] += 1
+
+            assignedRA[s] = r
+            assignedDates[r].append(day.getDate())
+
+            # The number of duty slots currently assigned is the number of
+            #  assignments that have not been undone.
+            stats["assignments"] += 1
+            depth = stats["assignments"] - stats["backtracks"]
+            if depth > stats["maxDepth"]:
+                stats["maxDepth"] = depth
+
+                # If this is the deepest the search has reached, then remember the
+                #  assignment in case a partial schedule is returned
+                if bestAssignment is not None:
+                    bestAssignment[:] = [None if a is None else raList[a] for a in assignedRA]
+
+            # Remove the RA from the domains of the unassigned neighboring slots
+            bit = 1 << r
+            pruned = []
+            wipeout = False
+            for t in neighbors[s]:
+                if assignedRA[t] is None and domains[t] & bit:
+                    domains[t] &= ~bit
+                    pruned.append(t)
+                    prunedBy[t].append(s)
+
+                    if domains[t] == 0:
+                        wipeout = True
+
+            return pruned, isFlagged, wipeout
+
+        def unassignSlot(s, r, pruned, isFlagged):
+            # Revert an assignment made by assignSlot
+            ra = raList[r]
+            day = slots[s]
+
+            # Add the RA back to the domains of the neighboring slots
+            bit = 1 << r
+            for t in pruned:
+                domains[t] |= bit
+                prunedBy[t].pop()
+
+            assignedDates[r].pop()
+            assignedRA[s] = None
+
+            if day.isDoubleDay():
+                numDoubleDays[ra] -= 1
+
+                if isFlagged:
+                    numFlagDuties[ra] -= 1
+
+            totals.revertAssignment(day.getPoints(), day.isDoubleDay(), isFlagged)
+            day.removeRA(ra)
+
+            stats["backtracks"] += 1
+
+        def getSortedCandidates(s):
+            # Return a list of the indexes of the RAs in the duty slot's domain
+            #  sorted from the best candidate to the worst. This mirrors the
+            #  candidate score used by State.getSortedWorkableRAs except that the
+            #  number of days since the RA was last assigned is the number of days
+            #  to their closest duty since duties may be assigned out of order.
+            #
+            #  This returns a tuple containing the sorted list and whether any RAs
+            #  were left out for having too many double-day duties.
+            day = slots[s]
+            date = day.getDate()
+            isFlagged = day.nextDutySlotIsFlagged()
+
+            ptsAvg = totals.getPointsAvg()
+            if day.isDoubleDay():
+                doubleDayAvg = totals.getDoubleDayAvg()
+                flagDutyAvg = totals.getFlagDutyAvg()
+
+            scoredCands = []
+            nddLimited = False
+            mask = domains[s]
+
+            stats["candidateEvaluations"] += bin(mask).count("1")
+            while mask:
+                # Take the lowest RA from the domain
+                bit = mask & -mask
+                mask ^= bit
+                r = bit.bit_length() - 1
+                ra = raList[r]
+
+                # If the RA has been assigned too many double-day duties
+                if day.isDoubleDay() and numDoubleDays[ra] > ((1 + nddTolerance) * doubleDayAvg):
+                    # Then the RA is not a candidate
+                    nddLimited = True
+                    continue
+
+                # Find the number of days to the RA's closest duty
+                daysFromDuty = date - lastDateAssigned[ra]
+                for d in assignedDates[r]:
+                    daysFromDuty = min(daysFromDuty, abs(date - d))
+
+                weight = 2 * ra.getPoints() - ptsAvg - daysFromDuty
+                weight += ra.getPoints() + day.getPoints() - ptsAvg
+
+                if day.isDoubleDay():
+                    weight += numDoubleDays[ra] - doubleDayAvg
+
+                    if isFlagged:
+                        weight += numFlagDuties[ra] - flagDutyAvg
+
+                scoredCands.append((weight, r))
+
+            # Sort by the score. Ties keep the order of the raList.
+            scoredCands.sort(key=lambda cand: cand[0])
+
+            return [r for _, r in scoredCands], nddLimited
+
+        def assignRemainingSlots():
+            # Recursively assign RAs to the remaining duty slots. This returns
+            #  True if successful or None if the node budget or timeout was
+            #  reached. Otherwise it returns the set of assigned duty slots that
+            #  caused the failure.
+            stats["nodes"] += 1
+
+            # If this process has run out of nodes or is taking longer than the
+            #  provided timeout
+            if searchBudgetExhausted(stats["nodes"], startTime, timeout, nodeBudget, timeoutCheckInterval):
+                return None
+
+            stats["statesPushed"] += 1
+
+            # Find the unassigned duty slot with the fewest RAs in its domain
+            best = None
+            bestSize = None
+            for s in range(len(slots)):
+                if assignedRA[s] is None:
+                    size = bin(domains[s]).count("1")
+                    if best is None or size < bestSize:
+                        best = s
+                        bestSize = size
+
+            # If every duty slot has been assigned, then we are finished
+            if best is None:
+                return True
+
+            candidates, nddLimited = getSortedCandidates(best)
+
+            # Start the conflict set with the duty slots whose assignments
+            #  removed RAs from this duty slot's domain.
+            conflictSet = set(prunedBy[best])
+
+            # If RAs were left out for having too many double-day duties, then
+            #  every assignment is to blame. Unlike the domains, the double-day
+            #  limit can loosen as more double-day duties are assigned, so
+            #  whether it empties this duty slot depends on the order in which
+            #  the duty slots are chosen, which depends on every assignment.
+            if nddLimited:
+                conflictSet.update(t for t in range(len(slots)) if assignedRA[t] is not None)
+
+            # Try each of the candidates for the duty slot
+            for r in candidates:
+                pruned, isFlagged, wipeout = assignSlot(best, r)
+
+                if wipeout:
+                    # If a duty slot was left without any RAs, then the duty slots
+                    #  that removed RAs from its domain are to blame as well.
+                    for t in pruned:
+                        if domains[t] == 0:
+                            conflictSet.update(prunedBy[t])
+
+                else:
+                    # Otherwise continue down this path
+                    res = assignRemainingSlots()
+
+                    # If we were successful or ran out of time, then stop
+                    if res is True or res is None:
+                        return res
+
+                    # If this duty slot did not cause the failure, then there is
+                    #  no point in trying its other candidates. Jump back to the
+                    #  most recent duty slot that did.
+                    if useBackjumping and best not in res:
+                        unassignSlot(best, r, pruned, isFlagged)
+                        stats["statesPopped"] += 1
+                        return res
+
+                    conflictSet.update(res)
+
+                unassignSlot(best, r, pruned, isFlagged)
+
+            # This duty slot has run out of candidates
+            conflictSet.discard(best)
+            stats["statesPopped"] += 1
+
+            # logging.debug("   Slot {} failed due to slots: {}".format(best, sorted(conflictSet)))
+
+            return conflictSet
+
+        res = assignRemainingSlots()
+
+        # Return True if successful, None if the node budget or timeout was reached, or False
+        #  if no schedule could be generated.
+        return res if res is True or res is None else False
+
+    def createNogoodSignature(day, raList, lastDateAssigned, numDoubleDays, numFlagDuties, ldaTolerance):
+        # Create and return a signature of the state of the search when it
+        #  reaches the provided day. Two states with the same signature have the
+        #  same possible assignments for the rest of the month, so if one has
+        #  been proven to have no solution, then so has the other.
+        #
+        #  A last date assigned only matters if it is within the ldaTolerance
+        #  of the day, otherwise it is treated as if the RA has not been assigned.
+        date = day.getDate()
+
+        return (
+            date,
+            day.getId(),
+            tuple(lastDateAssigned[ra] if lastDateAssigned[ra] != 0 and date - lastDateAssigned[ra] < ldaTolerance
+                  else 0 for ra in raList),
+            tuple(numDoubleDays[ra] for ra in raList),
+            tuple(numFlagDuties[ra] for ra in raList)
+        )
+
+    def createSymmetrySignature(ra, day, lastDateAssigned, numDoubleDays, ldaTolerance):
+        # Create and return a signature of everything about the provided RA that
+        #  decides where they can be assigned for the rest of the month once the
+        #  search reaches the provided day. Two RAs with the same signature are
+        #  interchangeable: swapping them in any assignment for the rest of the
+        #  month gives another valid assignment. So if assigning one of them to
+        #  the day has been proven to have no solution, then so has the other.
+        #
+        #  Points and flagged duties only affect the order in which candidates
+        #  are tried, not whether they can be assigned, so they are not included.
+        #  Conflicts before the day and last dates assigned outside of the
+        #  ldaTolerance no longer matter either.
+        date = day.getDate()
+        lda = lastDateAssigned[ra]
+
+        return (
+            ra.getConflictMask() >> date,
+            lda if lda != 0 and date - lda < ldaTolerance else 0,
+            numDoubleDays[ra]
+        )
+
+    def createDutySlots(year, month, noDutyDates, doubleDays, doublePts, doubleNum,
+                        doubleDates, doubleDateNum, doubleDatePts, breakDuties,
+                        setDDFlag):
+        # Create and return the list of duty slots that need to be filled for the
+        #  month in calendar order. Each duty slot is a Day object with a single
+        #  duty slot whose date, point value, double-day and flag attributes are
+        #  set when it is created. The search refers to each duty slot by its
+        #  index in the list. An example can be seen below.
+
+        #     dutySlots = [ Day(1), Day(2), Day(3, id=0), Day(3, id=1), Day(4) ]
+
+        # In the above example, Day 3 has two duties that need to be assigned
+        #  which is why it has two duty slots in the list. To the algorithm, the
+        #  fact that Day 3 has two duties does not matter, since the duty slots
+        #  for a date are always next to each other, they can be combined back
+        #  into a single Day once the schedule has been generated.
+
+        dutySlots = []
         for curMonthDay, curWeekDay in Calendar().itermonthdays2(year, month):
             # The iterator returned from the loop yields a tuple that
             #  contains an integer for the day of the week and the date
@@ -140,16 +704,13 @@ def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts
                         #  By default, this is Friday and Saturday: (4,5)
 
                         # Current date and point val
-                        d1 = Day(curMonthDay, curWeekDay, customPointVal=doublePts, isDoubleDay=True)
-                        dateDict[prevDay] = d1      # <- Set to the previous day
+                        dutySlots.append(
+                            Day(curMonthDay, curWeekDay, customPointVal=doublePts, isDoubleDay=True)
+                        )
 
-                        d_ = d1
                         for i in range(1, doubleNum):
-                            # Create the sub days such that if d1 = 1,
-                            #  then d_ will equal 1.1, 1.2, 1.3 etc...
-
-                            # Second node for current date and point val
-                            tmp = Day(
+                            # Create the additional duty slots for the date
+                            dutySlots.append(Day(
                                 curMonthDay,
                                 curWeekDay,
                                 dayID=i,
@@ -159,28 +720,20 @@ def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts
                                 #  AND this is the last double-day duty slot for this day.
                                 flagDutySlot=(setDDFlag and i == doubleNum - 1),
                                 numDutySlots=1
-                            )
-                            dateDict[d_] = tmp
-                            d_ = tmp
-
-                        # Set the previous day
-                        prevDay = d_
+                            ))
 
                     elif curMonthDay in doubleDates:
                         # If the date is a double date and should have multiple
                         #  RAs on duty.
 
                         # Current date and point val
-                        d1 = Day(curMonthDay, curWeekDay, customPointVal=doubleDatePts, isDoubleDay=True)
-                        dateDict[prevDay] = d1      # <- Set to the previous day
+                        dutySlots.append(
+                            Day(curMonthDay, curWeekDay, customPointVal=doubleDatePts, isDoubleDay=True)
+                        )
 
-                        d_ = d1
                         for i in range(1, doubleDateNum):
-                            # Create the sub days such that if d1 = 1,
-                            #  then d_ will equal 1.1, 1.2, 1.3 etc...
-
-                            # Second node for current date and point val
-                            tmp = Day(
+                            # Create the additional duty slots for the date
+                            dutySlots.append(Day(
                                 curMonthDay,
                                 curWeekDay,
                                 dayID=i,
@@ -190,57 +743,70 @@ def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts
                                 #  AND this is the last double-day duty slot for this day.
                                 flagDutySlot=(setDDFlag and i == doubleDateNum - 1),
                                 numDutySlots=1
-                            )
-                            dateDict[d_] = tmp
-                            d_ = tmp
-
-                        # Set the previous day
-                        prevDay = d_
+                            ))
 
                     else:
                         # Otherwise this is considered to be a regular duty day.
-
-                        # Set the previous day to reference the current day
-                        cmd = Day(
+                        dutySlots.append(Day(
                             curMonthDay,
                             curWeekDay,
                             customPointVal=regDutyPts,
                             isDoubleDay=False,
                             numDutySlots=1
-                        )
-                        dateDict[prevDay] = cmd
+                        ))
 
                         # If the number of duty slots for regular duties is greater than 1...
                         #  then create the extra duties.
-                        if regNumAssigned > 1:
-                            d_ = d1
-                            for i in range(1, regNumAssigned):
-                                # Create the sub days such that if d1 = 1,
-                                #  then d_ will equal 1.1, 1.2, 1.3 etc...
-
-                                # Second node for current date and point val
-                                tmp = Day(
-                                    curMonthDay,
-                                    curWeekDay,
-                                    dayID=i,
-                                    customPointVal=regDutyPts,
-                                    isDoubleDay=True
-                                )
-                                dateDict[d_] = tmp
-                                d_ = tmp
-
-                            # Set the previous day
-                            prevDay = d_
-
-                        else:
-                            # Otherwise set the original day as the previous day for the next
-                            #  day to use.
-                            prevDay = cmd
-
-                    # Set the last day
-                    dateDict[prevDay] = Day(-1, -1)
-
-        return dateDict
+                        for i in range(1, regNumAssigned):
+                            dutySlots.append(Day(
+                                curMonthDay,
+                                curWeekDay,
+                                dayID=i,
+                                customPointVal=regDutyPts,
+                                isDoubleDay=True
+                            ))
+
+        return dutySlots
+
+    def continuesSlotCombination(prevDay, day):
+        # Return whether the provided duty slot is filled as part of the same
+        #  combination of RAs as the duty slot before it. This is the case for
+        #  the duty slots of a date that have the same isDoubleDay value, since
+        #  an RA that can fill one of them can fill any of the later ones.
+        return prevDay.getDate() == day.getDate() and prevDay.isDoubleDay() == day.isDoubleDay()
+
+    def assignDutyFlags(dutySlots, numFlagDuties):
+        # Flag one duty for each double day with multiple duty slots. The flagged
+        #  duty is given to the RA on duty that date with the fewest flagged
+        #  duties, preferring the later duty slots when there is a tie. Duty
+        #  slots that have not been assigned are skipped. The numFlagDuties
+        #  dict is updated as the duties are flagged.
+        i = 0
+        while i < len(dutySlots):
+            # Find the duty slots for the current date
+            j = i + 1
+            while j < len(dutySlots) and dutySlots[j].getDate() == dutySlots[i].getDate():
+                j += 1
+
+            # If the date is a double day with multiple duty slots
+            if j - i > 1 and dutySlots[i].isDoubleDay():
+                # Find the RA on duty with the fewest flagged duties
+                flagRA = None
+                for day in reversed(dutySlots[i:j]):
+                    ra = day.getLastDutySlotAssignment()
+                    if ra is not None and (flagRA is None or numFlagDuties[ra] < numFlagDuties[flagRA]):
+                        flagRA = ra
+
+                # Flag the RA's duty
+                if flagRA is not None:
+                    for day in dutySlots[i:j]:
+                        for dutySlot in day.iterDutySlots():
+                            if dutySlot.getAssignment() == flagRA:
+                                dutySlot.setFlag(True)
+
+                    numFlagDuties[flagRA] += 1
+
+            i = j
 
     def createPreviousDuties(raList, prevDuties):
 
@@ -265,46 +831,28 @@ def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts
 
         return numDoubleDays, lastDateAssigned, numFlagDuties
 
-    def parseSchedule(cal):
+    def parseSchedule(dutySlots):
         # logging.debug("Parsing Generated Schedule")
-        # Generate and return the schedule object
+        # Generate and return the list of Days for the schedule object. Since
+        #  the duty slots are in calendar order, the duty slots for a given date
+        #  are next to each other and can be combined as they are reached.
         sched = []
-        prev = Day(-1, -1)
-        # logging.debug(" Calendar Length: {}".format(len(cal)))
-        # logging.debug(" Calendar keys: {}".format(sorted(cal.keys())))
-        for key in sorted(cal.keys()):
-
-            day = cal[key]
-            # logging.debug(" -- Top of Parsing Loop --\nPrev: {}\nKey: {}\nDay: {}".format(prev,key,day))
-            d = day.getDate()
-
-            # If the date is the same as the previous date, and the date is not -1
-            if d == prev.getDate() and d != -1:
-                # Then combine this day with the previous
-                # logging.debug("   Same as previous")
-                # Add a duty slot
-                prev.addDutySlot()
-
-                # Use the combineDay() method to simply append the
-                #  current day's duty slots to the previous
-                #  day's duty slots.
-                prev.combineDay(day)
+        for day in dutySlots:
+            # If the date is the same as the previous date
+            if len(sched) > 0 and day.getDate() == sched[-1].getDate():
+                # Then add a duty slot to the previous day and use the
+                #  combineDay() method to append the current day's duty
+                #  slots to the previous day's duty slots.
+                sched[-1].addDutySlot()
+                sched[-1].combineDay(day)
 
             else:
-                # logging.debug("   New Day")
-                # Add the previous day to the schedule
-                sched.append(prev)
-
-                #  and mark the current day as the new prev
-                prev = day
-
-            # input()
+                # Otherwise this is a new day in the schedule
+                sched.append(day)
 
         logging.debug("Finished Parsing Schedule")
 
-        # Return the completed schedule (minus the first entry as it was just
-        #  a part of the loop-and-a-half)
-        return sched[1:]
+        return sched
 
     def createFailedSchedule(year, month, noDutyDates, doubleDays, doubleDates, reason):
         # Create an empty Schedule object with a failure status.
@@ -318,15 +866,99 @@ def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts
 
         return retSched
 
+    def createPartialSchedule(year, month, noDutyDates, doubleDays, doubleDates, reason, bestAssignment):
+        # Create a Schedule object from the deepest assignment that the search
+        #  reached. The bestAssignment is a list of the RAs that were assigned to
+        #  the first duty slots, where a value of None marks a duty slot that was
+        #  not assigned. The remaining duty slots are filled one at a time with the
+        #  best candidate for each of them, if there is one, and any duty slots
+        #  that still cannot be filled are left empty. If every duty slot was
+        #  filled, the schedule has a status of SUCCESS. Otherwise, it has a
+        #  status of WARNING and the unfilled dates are listed in its notes.
+
+        # Clear the assignments that the search left behind
+        for day in dutySlots:
+            day.removeAllRAs()
+
+        # Start over from the previous month's duties
+        partialNDD, partialLDA, partialNFD = createPreviousDuties(raList, prevDuties)
+
+        for i, day in enumerate(dutySlots):
+            if i < len(bestAssignment) and bestAssignment[i] is not None:
+                # Reassign the RA from the deepest assignment
+                partialState = State(day, [bestAssignment[i]], partialLDA, partialNDD, ldaTolerance,
+                                     nddTolerance, partialNFD, predetermined=True)
+
+            else:
+                # Otherwise look for the best candidate for the duty slot. Since the
+                #  deepest assignment may have assigned later duty slots, the RAs
+                #  that it assigned within the ldaTolerance after this duty slot
+                #  cannot be candidates.
+                laterRAs = set(
+                    ra for ra, laterDay in zip(bestAssignment[i + 1:], dutySlots[i + 1:])
+                    if ra is not None and laterDay.getDate() - day.getDate() < ldaTolerance
+                )
+
+                partialState = State(day, [ra for ra in raList if ra not in laterRAs], partialLDA,
+                                     partialNDD, ldaTolerance, nddTolerance, partialNFD)
+
+            if not partialState.hasEmptyCandList():
+                partialState.assignNextRA()
+
+        # If the duty slots were filled as combinations, then flag the duties now
+        if combineSlots and setDDFlag:
+            assignDutyFlags(dutySlots, partialNFD)
+
+        # Find the dates that have duty slots that were left unfilled
+        unfilledSlots = [day for day in dutySlots if day.numberOnDuty() == 0]
+        unfilledDates = sorted(set(day.getDate() for day in unfilledSlots))
+
+        retSched = Schedule(
+            year, month, noDutyDates, parseSchedule(dutySlots), doubleDays, doubleDates,
+            status=Schedule.WARNING if len(unfilledSlots) > 0 else Schedule.SUCCESS
+        )
+
+        # If any of the duty slots were left unfilled, then let the user know
+        #  which dates still need to be assigned.
+        if len(unfilledSlots) > 0:
+            retSched.addNote(
+                "{} The duties on the following day(s) were left unfilled and need to be added manually: {}".format(
+                    reason, ", ".join(str(d) for d in unfilledDates)
+                ),
+                Schedule.WARNING
+            )
+
+        retSched.addStats({"unfilledDuties": len(unfilledSlots)})
+
+        return retSched
+
     # Create and prime the numDoubleDays, lastDateAssigned, and lastFlagDateAssigned dicts with the
     #  data from the previous month's schedule.
     numDoubleDays, lastDateAssigned, numFlagDuties = createPreviousDuties(raList, prevDuties)
 
+    # Whether the duty slots of a date are filled as a combination of RAs. In this
+    #  case, the duties are flagged after the schedule has been generated.
+    combineSlots = useSlotCombinations and useUndoTrail and not (useForwardChecking or useBackjumping)
+
+    # Let the caller know if any of the options that only apply to the undo trail
+    #  were requested for a different search since they will have no effect.
+    if useForwardChecking or useBackjumping or not useUndoTrail:
+        ignoredOptions = [name for name, isSet in (
+            ("nogoodCacheSize", nogoodCacheSize > 0),
+            ("useVectorizedScoring", useVectorizedScoring),
+            ("useSymmetryBreaking", useSymmetryBreaking),
+            ("useSlotCombinations", useSlotCombinations)
+        ) if isSet]
+
+        if len(ignoredOptions) > 0:
+            logging.warning(" The following options only apply to the undo trail search and will be ignored: {}"
+                            .format(", ".join(ignoredOptions)))
+
     # Create the calendar
     logging.debug(" Creating Calendar")
-    cal = createDateDict(year, month, noDutyDates, doubleDays, doublePts, doubleNum,
-                         doubleDates, doubleDateNum, doubleDatePts, breakDuties,
-                         setDDFlag)
+    dutySlots = createDutySlots(year, month, noDutyDates, doubleDays, doublePts, doubleNum,
+                                doubleDates, doubleDateNum, doubleDatePts, breakDuties,
+                                setDDFlag and not combineSlots)
 
     logging.debug(" Finished Creating Calendar")
 
@@ -334,19 +966,106 @@ def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts
     logging.debug(" Initial lastDateAssigned: {}".format(lastDateAssigned))
     logging.debug(" Initial numFlagDuties: {}".format(numFlagDuties))
 
+    # Determine which RAs are available for duty on each date
+    availMasks = createAvailabilityMasks(raList, dutySlots)
+
     # Check to see if there are too many conflicts to schedule
-    tooManyConsList = checkTooManyConflictsForSingleDay(raList, cal)
+    tooManyConsList = checkTooManyConflictsForSingleDay(dutySlots, availMasks)
     if len(tooManyConsList) > 0:
         # Package up a message to present to the user
-        return createFailedSchedule(
+        return addSearchStats(createFailedSchedule(
             year,
             month,
             noDutyDates,
             doubleDays,
             doubleDates,
             "A schedule could not be generated due to too many duty conflicts on the following day(s): {}".format(
-                ", ".join(str(d.getDate()) for d in tooManyConsList)
+                ", ".join(str(d) for d in tooManyConsList)
             )
+        ))
+
+    # Check to see if the duty slots can be covered with this ldaTolerance
+    bottleneckDates = findSlotCoverageBottleneck(dutySlots, raList, availMasks, lastDateAssigned, ldaTolerance)
+    if len(bottleneckDates) > 0:
+        # Package up a message to present to the user
+        return addSearchStats(createFailedSchedule(
+            year,
+            month,
+            noDutyDates,
+            doubleDays,
+            doubleDates,
+            "A schedule could not be generated because there are not enough available RAs to " +
+            "cover the duties on the following day(s): {}".format(
+                ", ".join(str(d) for d in bottleneckDates)
+            )
+        ))
+
+    # If we are using forward checking, then run that search instead of walking
+    #  the days in calendar order.
+    if useForwardChecking or useBackjumping:
+        logging.debug(" Beginning Scheduling With Forward Checking")
+
+        # The deepest assignment that the search reaches, in case a partial
+        #  schedule is returned
+        bestAssignment = []
+
+        searchStart = time.time()
+        res = searchWithForwardChecking(dutySlots, raList, availMasks, lastDateAssigned, numDoubleDays,
+                                        numFlagDuties, ldaTolerance, nddTolerance, searchStart, timeout,
+                                        useBackjumping, searchStats, nodeBudget, timeoutCheckInterval,
+                                        bestAssignment if useAnytimeScheduling else None)
+
+        logging.debug(" Finished Scheduling")
+
+        # If the search did not finish and we are returning partial schedules, then
+        #  package up the deepest assignment that the search reached
+        if res is None:
+            # Note that the search was cut short rather than proving that no
+            #  schedule exists
+            searchStats["budgetExhausted"] = 1
+
+        if not res and useAnytimeScheduling:
+            logging.info(" Returning Partial Schedule")
+
+            return addSearchStats(createPartialSchedule(
+                year,
+                month,
+                noDutyDates,
+                doubleDays,
+                doubleDates,
+                "The schedule took too long to create." if res is None
+                else "A complete schedule could not be generated.",
+                bestAssignment
+            ))
+
+        if res is None:
+            # Package up a message to present to the user
+            return addSearchStats(createFailedSchedule(
+                year,
+                month,
+                noDutyDates,
+                doubleDays,
+                doubleDates,
+                "The schedule took too long to create. " +
+                "Please check for missing Break Duties, No-Duty days, or Staff Members and try again."
+            ))
+
+        if not res:
+            logging.info(" Could Not Generate Schedule")
+
+            return addSearchStats(createFailedSchedule(
+                year,
+                month,
+                noDutyDates,
+                doubleDays,
+                doubleDates,
+                "A schedule could not be generated."
+            ))
+
+        logging.info("Finished Scheduling Process")
+
+        return addSearchStats(
+            Schedule(year, month, noDutyDates, parseSchedule(dutySlots), doubleDays, doubleDates, status=Schedule.SUCCESS)
         )
 
     stateStack = Stack()    # Stack of memory states for traversing the dates
@@ -358,35 +1077,127 @@ def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts
     #       3 | The numDoubleDays dictionary
     #       4 | The numFlagDuties dictionary
 
+    # If there are no duty slots to fill, then there is nothing to schedule
+    if len(dutySlots) == 0:
+        logging.info("Finished Scheduling Process")
+
+        return addSearchStats(Schedule(year, month, noDutyDates, [], doubleDays, doubleDates, status=Schedule.SUCCESS))
+
     logging.debug(" Initializing First Day")
     # Initialize the first day
-    curDay = cal[Day(0, -1)]
+    curDay = dutySlots[0]
+
+    # If we are using the undo trail, then keep running totals of the points,
+    #  double-day duties and flagged duties so that the States do not need to
+    #  sum over all of the RAs to calculate the averages.
+    runningTotals = State.RunningTotals(raList, numDoubleDays, numFlagDuties) if useUndoTrail else None
+
+    # If requested, then keep the RAs' points, lastDateAssigned, numDoubleDays and
+    #  numFlagDuties values in arrays so that the States can score all of the
+    #  candidates at once.
+    scoringArrays = None
+    if useVectorizedScoring and useUndoTrail:
+        if State.ScoringArrays.isSupported():
+            scoringArrays = State.ScoringArrays(raList, lastDateAssigned, numDoubleDays,
+                                                numFlagDuties, dutySlots[-1].getDate())
+
+        else:
+            logging.warning(" NumPy is not installed. Scoring candidates one RA at a time.")
 
     # Prime the stack with the first day and raList
+    #  In undo trail mode, the candidates are kept in heaps since the States are
+    #  never copied and usually only their first few candidates are ever tried.
     startState = State(curDay, raList, lastDateAssigned, numDoubleDays,
-                       ldaTolerance, nddTolerance, numFlagDuties)
+                       ldaTolerance, nddTolerance, numFlagDuties, runningTotals=runningTotals,
+                       lazyCandidates=useUndoTrail, scoringArrays=scoringArrays)
 
     stateStack.push(startState)
+    searchStats["statesPushed"] += 1
+    searchStats["candidateEvaluations"] += len(raList)
+
+    # If we are using the undo trail, then remember the signatures of the states
+    #  that have been proven to have no solution. The least recently used
+    #  signatures are forgotten once nogoodCacheSize is reached.
+    nogoods = OrderedDict() if useUndoTrail and nogoodCacheSize > 0 else None
+    nogoodHits = 0
+    nogoodMisses = 0
+
+    # If we are filling the duty slots of a date as a combination, then determine
+    #  which duty slots continue the combination of the duty slot before them.
+    #  Every ordering of the RAs in a combination would otherwise be tried, so
+    #  only the orderings where each RA was a remaining candidate of the previous
+    #  duty slot are searched.
+    combinedSlots = None
+    if combineSlots:
+        combinedSlots = [False] + [continuesSlotCombination(dutySlots[i - 1], dutySlots[i])
+                                   for i in range(1, len(dutySlots))]
+
+    # If we are breaking symmetries, then remember the signatures of the RAs that
+    #  have been tried on each of the states in the stack.
+    triedSignatures = [set()] if useUndoTrail and useSymmetryBreaking else None
+    symmetrySkips = 0
+
+    def addNogoodCacheNote(sched):
+        # Add the nogood cache's hit and miss counts and the number of candidates
+        #  that were skipped by symmetry breaking to the provided schedule's notes
+        #  and search statistics
+        if nogoods is not None:
+            sched.addNote("Nogood cache: {} hit(s), {} miss(es)".format(nogoodHits, nogoodMisses))
+            sched.addStats({"nogoodHits": nogoodHits, "nogoodMisses": nogoodMisses})
+
+        if triedSignatures is not None:
+            sched.addNote("Symmetry breaking: {} candidate(s) skipped".format(symmetrySkips))
+            sched.addStats({"symmetrySkips": symmetrySkips})
+
+        return addSearchStats(sched)
 
     logging.debug(" Finished Initializing First Day")
 
     logging.debug(" Beginning Scheduling")
 
+    # Whether every duty slot has been assigned
+    completed = False
+
+    # If we are returning partial schedules, then remember the RAs assigned to
+    #  the duty slots the deepest time the search has reached
+    bestAssignment = []
+
     start_time = time.time()
-    while not stateStack.isEmpty() and curDay.getDate() != -1:
+    searchStart = start_time
+    while not stateStack.isEmpty() and not completed:
 
-        # Check how long we've been working on this schedule attempt
-        cur_time = time.time()
+        # Count each pass through the loop as a node of the search
+        searchStats["nodes"] += 1
 
         # Debugging timeout
         # logging.debug(
-        #     "Elapsed Time: {} > {} = {}".format(cur_time - start_time, timeout, cur_time - start_time > timeout)
+        #     "Elapsed Time: {} > {} = {}".format(time.time() - start_time, timeout, time.time() - start_time > timeout)
         # )
 
-        # If this process is taking longer than the provided timeout
-        if cur_time - start_time > timeout:
+        # If this process has run out of nodes or is taking longer than the
+        #  provided timeout
+        if searchBudgetExhausted(searchStats["nodes"], start_time, timeout, nodeBudget, timeoutCheckInterval):
+            # Note that the search was cut short rather than proving that no
+            #  schedule exists
+            searchStats["budgetExhausted"] = 1
+
+            # If we are returning partial schedules, then package up the deepest
+            #  assignment that the search reached
+            if useAnytimeScheduling:
+                logging.info(" Returning Partial Schedule")
+
+                return addNogoodCacheNote(createPartialSchedule(
+                    year,
+                    month,
+                    noDutyDates,
+                    doubleDays,
+                    doubleDates,
+                    "The schedule took too long to create.",
+                    bestAssignment
+                ))
+
             # Package up a message to present to the user
-            return createFailedSchedule(
+            return addNogoodCacheNote(createFailedSchedule(
                 year,
                 month,
                 noDutyDates,
@@ -394,54 +1205,166 @@ def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts
                 doubleDates,
                 "The schedule took too long to create. " +
                 "Please check for missing Break Duties, No-Duty days, or Staff Members and try again."
-            )
-
-        # Get the current working state off the stack
-        curState = stateStack.pop()
-        curDay, candList, lastDateAssigned, numDoubleDays, numFlagDuties = curState.restoreState()
-
-        # logging.debug("--TOP OF SCHEDULE LOOP--\n" +
-        #               "Current Day: {}\nCandidate List: {}\nlastDateAssigned: {}\nnumDoubleDays: {}"
-        #               .format(curDay, candList, lastDateAssigned, numDoubleDays))
-        # input("  Hit 'Enter' to continue ")
-
-        # If there are no more candidate RAs for a given day, then go back to
-        #  the previous state.
-        if curState.hasEmptyCandList():
-            # logging.debug("   NO CANDIDATES")
+            ))
+
+        # Each state on the stack is for the duty slot after the state below it,
+        #  so the index of the current duty slot is its position in the stack.
+        curIdx = stateStack.size() - 1
+
+        if useUndoTrail:
+            # In undo trail mode, the states remain on the stack until all of
+            #  their candidates have been exhausted. All states share the same
+            #  lastDateAssigned, numDoubleDays and numFlagDuties dicts which are
+            #  updated in place as RAs are assigned and unassigned.
+            curState = stateStack.peek()
+            curDay = curState.curDay
+
+            # Check to see if we have come back from a subsequent state. If so,
+            #  then revert the assignment that was made on this state's day.
+            if curState.hasUndoableAssignments():
+                # logging.debug("   REVISTED DAY")
+                curState.undoAssignments()
+                searchStats["backtracks"] += 1
+
+            # If we are breaking symmetries, then skip the candidates that are
+            #  interchangeable with a candidate that has already been tried.
+            if triedSignatures is not None:
+                while not curState.hasEmptyCandList():
+                    signature = createSymmetrySignature(curState.peekNextCandidate(), curDay,
+                                                        lastDateAssigned, numDoubleDays, ldaTolerance)
+
+                    if signature not in triedSignatures[curIdx]:
+                        triedSignatures[curIdx].add(signature)
+                        break
+
+                    curState.getNextCandidate()
+                    symmetrySkips += 1
+
+            # If there are no more candidate RAs for a given day, then go back to
+            #  the previous state.
+            if curState.hasEmptyCandList():
+                # logging.debug("   NO CANDIDATES")
+                stateStack.pop()
+                searchStats["statesPopped"] += 1
+
+                if triedSignatures is not None:
+                    triedSignatures.pop()
+
+                # This state has now been proven to have no solution. A duty slot
+                #  that continues a combination only searched some of the RAs, so
+                #  it is not remembered.
+                if nogoods is not None and not (combinedSlots is not None and combinedSlots[curIdx]):
+                    nogoods[createNogoodSignature(curDay, raList, lastDateAssigned, numDoubleDays,
+                                                  numFlagDuties, ldaTolerance)] = None
+
+                    if len(nogoods) > nogoodCacheSize:
+                        nogoods.popitem(last=False)
+
+                continue
+
+            curState.assignNextRA()
+
+        else:
+            # Get the current working state off the stack
+            curState = stateStack.pop()
+            searchStats["statesPopped"] += 1
+            curDay, candList, lastDateAssigned, numDoubleDays, numFlagDuties = curState.restoreState()
+
+            # logging.debug("--TOP OF SCHEDULE LOOP--\n" +
+            #               "Current Day: {}\nCandidate List: {}\nlastDateAssigned: {}\nnumDoubleDays: {}"
+            #               .format(curDay, candList, lastDateAssigned, numDoubleDays))
+            # input("  Hit 'Enter' to continue ")
+
+            # If there are no more candidate RAs for a given day, then go back to
+            #  the previous state.
+            if curState.hasEmptyCandList():
+                # logging.debug("   NO CANDIDATES")
+                continue
+
+            # Check to see if we have come back from a subsequent state. This will
+            #  be asserted if an RA has been assigned a duty for the current day.
+            if curState.returnedFromPreviousState():
+                # If we are returning from a subsequent day, then remove the RA(s)
+                #  that was assigned.
+                # logging.debug("   REVISTED DAY")
+                curDay.removeAllRAs()
+                searchStats["backtracks"] += 1
+
+            curState.assignNextRA()
+
+            # Put the updated current state back on the stateStack
+            curStateCopy = curState.deepcopy()
+            stateStack.push(curStateCopy)
+            searchStats["statesPushed"] += 1
+
+        # Every duty slot up to and including the current one is now assigned
+        searchStats["assignments"] += 1
+        if curIdx + 1 > searchStats["maxDepth"]:
+            searchStats["maxDepth"] = curIdx + 1
+
+            # If this is the deepest the search has reached, then remember the
+            #  assignment in case a partial schedule is returned
+            if useAnytimeScheduling:
+                bestAssignment = [day.getLastDutySlotAssignment() for day in dutySlots[:curIdx + 1]]
+
+        # If this was the last duty slot, then every duty slot has been assigned
+        if curIdx + 1 == len(dutySlots):
+            completed = True
             continue
 
-        # Check to see if we have come back from a subsequent state. This will
-        #  be asserted if an RA has been assigned a duty for the current day.
-        if curState.returnedFromPreviousState():
-            # If we are returning from a subsequent day, then remove the RA(s)
-            #  that was assigned.
-            # logging.debug("   REVISTED DAY")
-            curDay.removeAllRAs()
+        # Get the next Day
+        nextDay = dutySlots[curIdx + 1]
+
+        # Whether the next duty slot continues the combination of the current one
+        continuesCombination = combinedSlots is not None and combinedSlots[curIdx + 1]
 
-        curState.assignNextRA()
+        # If we are using the nogood cache, then check to see if an equivalent
+        #  state for the next day has already been proven to have no solution.
+        if nogoods is not None and not continuesCombination:
+            signature = createNogoodSignature(nextDay, raList, lastDateAssigned, numDoubleDays,
+                                              numFlagDuties, ldaTolerance)
 
-        # Put the updated current state back on the stateStack
-        curStateCopy = curState.deepcopy()
-        stateStack.push(curStateCopy)
+            if signature in nogoods:
+                # If so, then try a different path on the current state
+                nogoods.move_to_end(signature)
+                nogoodHits += 1
+                continue
 
-        # Get the next Day
-        nextDay = cal[curDay]
+            nogoodMisses += 1
 
         # Generate the next State
-        nextState = State(nextDay, raList, lastDateAssigned, numDoubleDays,
-                          ldaTolerance, nddTolerance, numFlagDuties)
+        if continuesCombination:
+            # If the next duty slot continues the combination, then only the RAs
+            #  that were not yet tried for the current duty slot can fill it. The
+            #  RAs that were not candidates are included since they may become
+            #  candidates as more double-day duties are assigned.
+            remainingRAs = set(curState.getCandidates())
+            remainingRAs.update(curState.getConflictCandidates())
+
+            nextRAList = [ra for ra in raList if ra in remainingRAs]
+            nextState = State(nextDay, nextRAList, lastDateAssigned,
+                              numDoubleDays, ldaTolerance, nddTolerance, numFlagDuties,
+                              runningTotals=runningTotals, lazyCandidates=useUndoTrail,
+                              scoringArrays=scoringArrays)
+            searchStats["candidateEvaluations"] += len(nextRAList)
+
+        else:
+            nextState = State(nextDay, raList, lastDateAssigned, numDoubleDays,
+                              ldaTolerance, nddTolerance, numFlagDuties, runningTotals=runningTotals,
+                              lazyCandidates=useUndoTrail, scoringArrays=scoringArrays)
+            searchStats["candidateEvaluations"] += len(raList)
 
         # If there is at least one RA that can be scheduled for the next day,
-        #  or the current day is the end of the month, then add the next day to
-        #  the stateStack. Otherwise, we will need to try a different path on
-        #  the current state
-        if not(nextState.hasEmptyCandList()) or nextDay.getDate() == -1:
+        #  then add the next day to the stateStack. Otherwise, we will need to
+        #  try a different path on the current state
+        if not(nextState.hasEmptyCandList()):
             # logging.debug("   MOVING TO NEXT DAY")
             # Add the next day on the stack
             stateStack.push(nextState)
+            searchStats["statesPushed"] += 1
 
-            curDay = nextDay    # Move on to the next day
+            if triedSignatures is not None:
+                triedSignatures.append(set())
 
         # input()
 
@@ -450,22 +1373,42 @@ def schedule(raList, year, month, noDutyDates=None, doubleDays=(4, 5), doublePts
     # We've made it out of the scheduling loop meaning we either were not able to
     #  find a solution, or we were successful
 
-    if stateStack.isEmpty():
+    if not completed:
         # If the stateStack is empty, then the algorithm could not create a schedule.
         logging.info(" Could Not Generate Schedule")
 
-        return createFailedSchedule(
+        # If we are returning partial schedules, then package up the deepest
+        #  assignment that the search reached
+        if useAnytimeScheduling:
+            return addNogoodCacheNote(createPartialSchedule(
+                year,
+                month,
+                noDutyDates,
+                doubleDays,
+                doubleDates,
+                "A complete schedule could not be generated.",
+                bestAssignment
+            ))
+
+        return addNogoodCacheNote(createFailedSchedule(
             year,
             month,
             noDutyDates,
             doubleDays,
             doubleDates,
             "A schedule could not be generated."
-        )
+        ))
+
+    # If the duty slots were filled as combinations, then flag the duties now
+    #  that the RAs on duty for each date are known.
+    if combineSlots and setDDFlag:
+        assignDutyFlags(dutySlots, numFlagDuties)
 
     logging.info("Finished Scheduling Process")
 
-    return Schedule(year, month, noDutyDates, parseSchedule(cal), doubleDays, doubleDates, status=Schedule.SUCCESS)
+    return addNogoodCacheNote(
+        Schedule(year, month, noDutyDates, parseSchedule(dutySlots), doubleDays, doubleDates, status=Schedule.SUCCESS)
+    )
 
 
 if __name__ == "__main__":
@@ -477,8 +1420,6 @@ if __name__ == "__main__":
             23.1: 24, 24: 24.1, 24.1: 25, 25: 26, 26: 27, 27: 28,
             28: 29, 29: 30, 30: 30.1, 30.1: 31, 31: 31.1, 31.1: -1}
 
-    import random
-
     raList = []
     i = 0
     for name in "abcdefghijklmnop":
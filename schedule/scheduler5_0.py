@@ -231,6 +231,91 @@ def schedule(raList, year, month, noDutyDates=[], doubleDays=(4, 5), doublePts=2
 
         return numDoubleDays, lastDateAssigned, numFlagDuties
 
+    def findSlotCoverageBottleneck(cal, raList, lastDateAssigned, ldaTolerance):
+        # Check to ensure that the duty slots can be covered given the RAs'
+        #  conflicts and the ldaTolerance. Since an RA cannot be assigned more
+        #  than one duty within any window of ldaTolerance consecutive dates,
+        #  every such window must have a matching between its duty slots and
+        #  the RAs who are available for them. If a window does not, then no
+        #  schedule can be generated without overriding duty conflicts.
+        #
+        #  By Hall's theorem, if a duty slot cannot be matched, then the slots
+        #  reached while searching for a match need more RAs than are available
+        #  to them. The sorted list of the dates of these slots is returned. If
+        #  every window can be matched, an empty list is returned.
+
+        # Count the number of duty slots that need to be filled on each date
+        slotCountDict = {}
+        for day in cal.values():
+            if day.getDate() != -1:
+                slotCountDict[day.getDate()] = slotCountDict.get(day.getDate(), 0) + 1
+
+        dates = sorted(slotCountDict.keys())
+
+        # Create a bitmask for each date where bit 'i' is set if the RA at
+        #  position 'i' of the raList does not have a conflict on that date and
+        #  is not within the ldaTolerance of a duty from the previous month.
+        windowMasks = {}
+        for d in dates:
+            windowMasks[d] = 0
+            for i, ra in enumerate(raList):
+                lda = lastDateAssigned[ra][-1]
+                if d not in ra.getConflicts() and (lda == 0 or d - lda >= ldaTolerance):
+                    windowMasks[d] |= 1 << i
+
+        # Iterate over each window of ldaTolerance dates. Only windows that start
+        #  on a date with duty slots need to be checked since any other window's
+        #  slots are contained in the window starting at its next duty date.
+        for startIdx, start in enumerate(dates):
+            # Gather the dates of the duty slots within this window
+            windowSlots = []
+            for d in dates[startIdx:]:
+                if d >= start + ldaTolerance:
+                    break
+
+                windowSlots.extend([d] * slotCountDict[d])
+
+            # Map the index of each matched RA to the index of its duty slot
+            slotForRA = {}
+
+            def findAugmentingPath(slotIdx, visited):
+                # Try to match the duty slot with an available RA, moving RAs who
+                #  are already matched to other slots if necessary. The 'visited'
+                #  list holds a bitmask of the RAs that have been tried.
+                candidates = windowMasks[windowSlots[slotIdx]]
+                while candidates:
+                    # Take the lowest available RA from the candidates
+                    bit = candidates & -candidates
+                    candidates ^= bit
+
+                    # Skip RAs that have already been tried during this search
+                    if visited[0] & bit:
+                        continue
+
+                    visited[0] |= bit
+                    raIdx = bit.bit_length() - 1
+
+                    # If the RA is not matched, or the slot they are matched to can
+                    #  be matched with someone else, then match the RA with this slot
+                    if raIdx not in slotForRA or findAugmentingPath(slotForRA[raIdx], visited):
+                        slotForRA[raIdx] = slotIdx
+                        return True
+
+                return False
+
+            for slotIdx in range(len(windowSlots)):
+                visited = [0]
+                if not findAugmentingPath(slotIdx, visited):
+                    # The slots reached during the search are this slot and the
+                    #  slots matched to every RA that was tried.
+                    bottleneckSlots = [slotIdx] + [
+                        slotForRA[raIdx] for raIdx in range(len(raList)) if visited[0] & (1 << raIdx)
+                    ]
+
+                    return sorted(set(windowSlots[i] for i in bottleneckSlots))
+
+        return []
+
     # Create and prime the numDoubleDays, lastDateAssigned, and lastFlagDateAssigned dicts with the
     #  data from the previous month's schedule.
     numDoubleDays, lastDateAssigned, numFlagDuties = createPreviousDuties(raList, prevDuties)
@@ -247,6 +332,17 @@ def schedule(raList, year, month, noDutyDates=[], doubleDays=(4, 5), doublePts=2
     logging.debug(" Initial lastDateAssigned: {}".format(lastDateAssigned))
     logging.debug(" Initial numFlagDuties: {}".format(numFlagDuties))
 
+    # If this run is not configured to override duty conflicts, then check to see
+    #  if the duty slots can be covered with this ldaTolerance before searching.
+    if not assignConflicts:
+        bottleneckDates = findSlotCoverageBottleneck(cal, raList, lastDateAssigned, ldaTolerance)
+        if len(bottleneckDates) > 0:
+            logging.info(" Not Enough Available RAs to Cover Day(s): {}".format(
+                ", ".join(str(d) for d in bottleneckDates)))
+
+            # Since the search was never started, there is no furthest state
+            return [], None
+
     stateStack = Stack()  # Stack of memory states for traversing the dates
     # The stack contains tuples of the following objects:
     #       0: Date object for the given state
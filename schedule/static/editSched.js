@@ -783,6 +783,12 @@ function showSchedQueueModal(info) {
             badgeStatusText = "Success";
             break;
 
+        case 2:
+            // Status indicates a newer request was run instead
+            badgeStatusColor += "info";
+            badgeStatusText = "Superseded";
+            break;
+
         case -3:
         case -2:
         case -1:
@@ -854,6 +860,9 @@ function addSchedReqItem(schedReqDict) {
         case 1:
             statusText = "Success";
             break;
+        case 2:
+            statusText = "Superseded";
+            break;
         default:
             statusText = "Unknown";
     }
@@ -906,6 +915,10 @@ function updateSchedReqList(schedReqDict) {
                 statusText = "Success";
                 statusClass = "badge-success";
                 break;
+            case 2:
+                statusText = "Superseded";
+                statusClass = "badge-info";
+                break;
             default:
             statusText = "Unknown";
             statusClass = "badge-warning";
@@ -36,6 +36,8 @@ class TestRAObject(unittest.TestCase):
     def test_hasExpectedMethods(self):
         # Test to ensure that the RA Object has the following methods:
         #  - getConflicts
+        #  - getConflictMask
+        #  - hasConflict
         #  - getId
         #  - getStartDate
         #  - getPoints
@@ -49,6 +51,8 @@ class TestRAObject(unittest.TestCase):
         # -- Assert --
 
         self.assertTrue(hasattr(RA, "getConflicts"))
+        self.assertTrue(hasattr(RA, "getConflictMask"))
+        self.assertTrue(hasattr(RA, "hasConflict"))
         self.assertTrue(hasattr(RA, "getId"))
         self.assertTrue(hasattr(RA, "getStartDate"))
         self.assertTrue(hasattr(RA, "getPoints"))
@@ -103,6 +107,25 @@ class TestRAObject(unittest.TestCase):
         self.assertIsInstance(testRAObject.conflicts, list)
         self.assertIsInstance(testRAObject.points, int)
 
+    def test_usesSlotsForAttributes(self):
+        # Test to ensure that the RA Object stores its attributes in slots
+        #  rather than in a per-instance dictionary.
+
+        # -- Arrange --
+
+        # Create the RA Object being tested
+        testRAObject = RA("User", "Test", 99, 12, date(2021, 2, 12), [1, 2, 3], 1234)
+
+        # -- Act --
+        # -- Assert --
+
+        # Assert that the RA Object does not have an instance dictionary
+        self.assertFalse(hasattr(testRAObject, "__dict__"))
+
+        # Assert that new attributes cannot be added to the RA Object
+        with self.assertRaises(AttributeError):
+            testRAObject.notAnAttribute = 1
+
     def test_hasExpectedDefaultValues(self):
         # Test to ensure that when omitting non-required parameters
         #  when constructing an RA Object, the default values are
@@ -538,6 +561,80 @@ class TestRAObject(unittest.TestCase):
         # Assert that we received the expected result
         self.assertEqual(desiredConflicts, result)
 
+    def test_getConflictMask_returnsBitmaskOfIntegerConflicts(self):
+        # Test to ensure that the getConflictMask method returns a bitmask
+        #  with a bit set for each of the RA Object's integer conflicts.
+
+        # -- Arrange --
+
+        # Create the objects to be used in this test
+        desiredFirstName = "User"
+        desiredLastName = "Test"
+        desiredID = 99
+        desiredHallID = 12
+        desiredDateStarted = date(2021, 2, 17)
+        desiredPoints = 25
+        desiredConflicts = [1, 5, 31, "2021-02-17"]
+        expectedMask = (1 << 1) | (1 << 5) | (1 << 31)
+
+        # Create the RA Object being tested
+        testRAObject = RA(
+            desiredFirstName,
+            desiredLastName,
+            desiredID,
+            desiredHallID,
+            desiredDateStarted,
+            points=desiredPoints,
+            conflicts=desiredConflicts
+        )
+
+        # -- Act --
+
+        # Call the method being tested
+        result = testRAObject.getConflictMask()
+
+        # -- Assert --
+
+        # Assert that we received the expected result
+        self.assertEqual(expectedMask, result)
+
+    def test_hasConflict_returnsTrueIfAndOnlyIfRAHasConflictOnDate(self):
+        # Test to ensure that the hasConflict method returns True if and
+        #  only if the provided date is one of the RA Object's conflicts.
+
+        # -- Arrange --
+
+        # Create the objects to be used in this test
+        desiredFirstName = "User"
+        desiredLastName = "Test"
+        desiredID = 99
+        desiredHallID = 12
+        desiredDateStarted = date(2021, 2, 17)
+        desiredPoints = 25
+        desiredConflicts = [1, 5, 31, "2021-02-17"]
+
+        # Create the RA Object being tested
+        testRAObject = RA(
+            desiredFirstName,
+            desiredLastName,
+            desiredID,
+            desiredHallID,
+            desiredDateStarted,
+            points=desiredPoints,
+            conflicts=desiredConflicts
+        )
+
+        # -- Act --
+        # -- Assert --
+
+        # Assert that every conflict is found
+        for con in desiredConflicts:
+            self.assertTrue(testRAObject.hasConflict(con))
+
+        # Assert that dates which are not conflicts are not found
+        for notCon in [0, 2, 30, 32, -1, "2021-02-18"]:
+            self.assertFalse(testRAObject.hasConflict(notCon))
+
     def test_getId_returnsIDAttribute(self):
         # Test to ensure that the getId method returns the RA Object's
         #  ID attribute
@@ -60,6 +60,8 @@ class TestScheduleObject(unittest.TestCase):
         self.assertTrue(hasattr(Schedule, "getStatus"))
         self.assertTrue(hasattr(Schedule, "addNote"))
         self.assertTrue(hasattr(Schedule, "getNotes"))
+        self.assertTrue(hasattr(Schedule, "addStats"))
+        self.assertTrue(hasattr(Schedule, "getStats"))
 
     def test_ScheduleObject_hasExpectedProperties(self):
         # Test to ensure that the Schedule Object has the following properties:
@@ -71,6 +73,7 @@ class TestScheduleObject(unittest.TestCase):
         #  - schedule
         #  - schedNotes
         #  - status
+        #  - stats
         #  - ERROR
         #  - FAIL
         #  - WARNING
@@ -94,6 +97,7 @@ class TestScheduleObject(unittest.TestCase):
         self.assertIsInstance(testSchedule.schedule, list)
         self.assertIsInstance(testSchedule.schedNotes, list)
         self.assertIsInstance(testSchedule.status, int)
+        self.assertIsInstance(testSchedule.stats, dict)
         self.assertIsInstance(testSchedule.ERROR, int)
         self.assertIsInstance(testSchedule.FAIL, int)
         self.assertIsInstance(testSchedule.WARNING, int)
@@ -606,6 +610,54 @@ class TestScheduleObject(unittest.TestCase):
         # Assert that the method added the notes to the
         self.assertListEqual(testSchedule.schedNotes, result)
 
+    def test_ScheduleObject_addStats_mergesProvidedStatsIntoStats(self):
+        # Test to ensure that the addStats method adds the provided statistics
+        #  to the Schedule Object's stats dictionary and replaces any statistics
+        #  that have already been recorded with the same name.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        testSchedule = Schedule(2021, 8)
+        expectedStats = {"backtracks": 3, "maxDepth": 12, "searchSeconds": 0.5}
+
+        # -- Act --
+
+        # Call the method being tested twice with an overlapping statistic
+        testSchedule.addStats({"backtracks": 1, "maxDepth": 12})
+        testSchedule.addStats({"backtracks": 3, "searchSeconds": 0.5})
+
+        # -- Assert --
+
+        # Assert that the statistics were merged as expected
+        self.assertDictEqual(testSchedule.stats, expectedStats)
+
+    def test_ScheduleObject_getStats_returnsStatsDictionary(self):
+        # Test to ensure that the getStats method returns the Schedule Object's
+        #  stats dictionary, which is empty by default.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        testSchedule = Schedule(2021, 8)
+        defaultSchedule = Schedule(2021, 8)
+
+        testSchedule.addStats({"statesPushed": 5})
+
+        # -- Act --
+
+        # Call the method being tested
+        result = testSchedule.getStats()
+        defaultResult = defaultSchedule.getStats()
+
+        # -- Assert --
+
+        # Assert that the default stats are empty
+        self.assertDictEqual(defaultResult, {})
+
+        # Assert that the method returned the stats dictionary
+        self.assertIs(testSchedule.stats, result)
+
     # ---------------------------
     # -- Tests for Note Object --
     # ---------------------------
@@ -1,4 +1,4 @@
-from schedule.ra_sched import State, Day, RA
+from schedule.ra_sched import State, Day, RA, np
 from unittest.mock import patch
 import unittest
 
@@ -36,12 +36,18 @@ class TestStateObject(unittest.TestCase):
         #  - hasEmptyConList
         #  - returnedFromPreviousState
         #  - isDoubleDay
+        #  - peekNextCandidate
         #  - getNextCandidate
         #  - assignNextRA
         #  - getSortedWorkableRAs
+        #  - getScoredWorkableRAs
+        #  - getCandidates
+        #  - getConflictCandidates
         #  - getNextConflictCandidate
         #  - assignNextConflictRA
         #  - assignRA
+        #  - undoAssignments
+        #  - hasUndoableAssignments
 
         # -- Arrange --
         # -- Act --
@@ -54,12 +60,18 @@ class TestStateObject(unittest.TestCase):
         self.assertTrue(hasattr(State, "hasEmptyConList"))
         self.assertTrue(hasattr(State, "returnedFromPreviousState"))
         self.assertTrue(hasattr(State, "isDoubleDay"))
+        self.assertTrue(hasattr(State, "peekNextCandidate"))
         self.assertTrue(hasattr(State, "getNextCandidate"))
         self.assertTrue(hasattr(State, "assignNextRA"))
         self.assertTrue(hasattr(State, "getSortedWorkableRAs"))
+        self.assertTrue(hasattr(State, "getScoredWorkableRAs"))
+        self.assertTrue(hasattr(State, "getCandidates"))
+        self.assertTrue(hasattr(State, "getConflictCandidates"))
         self.assertTrue(hasattr(State, "getNextConflictCandidate"))
         self.assertTrue(hasattr(State, "assignNextConflictRA"))
         self.assertTrue(hasattr(State, "assignRA"))
+        self.assertTrue(hasattr(State, "undoAssignments"))
+        self.assertTrue(hasattr(State, "hasUndoableAssignments"))
 
     def test_hasExpectedProperties(self):
         # Test to ensure that the State Object has the following properties:
@@ -282,6 +294,233 @@ class TestStateObject(unittest.TestCase):
         self.assertListEqual(testState.candList, expectedCandList)
         self.assertListEqual(testState.conList, expectedConList)
 
+    def test_whenLazyCandidatesIsTrue_popsCandidatesInSameOrderAsSortedCandList(self):
+        # Test to ensure that when the 'lazyCandidates' parameter is set to True, the
+        #  State Object's candidates and conflict candidates are popped in the same
+        #  order as they appear in the sorted candList and conList.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredDate = 27
+        desiredDay = Day(desiredDate, 1)
+        desiredLDATolerance = 15
+        desiredNDDTolerance = .141
+        desiredLastDateAssigned = {}
+        desiredNumDoubleDays = {}
+        desiredNumFlagDuties = {}
+        desiredRAList = [
+            # Candidate RAs
+            RA("Test", "RA1", 1, 1, "2021-08-27", points=3),
+            RA("Test", "RA2", 2, 1, "2021-08-27", points=1),
+            RA("Test", "RA3", 3, 1, "2021-08-27", points=2),
+            RA("Test", "RA4", 4, 1, "2021-08-27", points=1),
+            # Conflict RAs
+            RA("Test", "RA5", 5, 1, "2021-08-27", conflicts=[desiredDate], points=4),
+            RA("Test", "RA6", 6, 1, "2021-08-27", conflicts=[desiredDate], points=0)
+        ]
+
+        # Populate the lda, ndd, and nfd dictionaries
+        for ra in desiredRAList:
+            desiredLastDateAssigned[ra] = 0
+            desiredNumDoubleDays[ra] = 0
+            desiredNumFlagDuties[ra] = 0
+
+        # Create the State object that sorts its candidates
+        sortedState = State(
+            desiredDay,
+            desiredRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredLDATolerance,
+            desiredNDDTolerance,
+            desiredNumFlagDuties
+        )
+
+        # -- Act --
+
+        # Create the State object being tested
+        testState = State(
+            desiredDay,
+            desiredRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredLDATolerance,
+            desiredNDDTolerance,
+            desiredNumFlagDuties,
+            lazyCandidates=True
+        )
+
+        # Get the remaining candidates before any are popped
+        resCandidates = testState.getCandidates()
+        resConflictCandidates = testState.getConflictCandidates()
+
+        # Pop all of the candidates and conflict candidates
+        resCandList = []
+        while not testState.hasEmptyCandList():
+            resCandList.append(testState.getNextCandidate())
+
+        resConList = []
+        while not testState.hasEmptyConList():
+            resConList.append(testState.getNextConflictCandidate())
+
+        # -- Assert --
+
+        # Assert that the candidates were popped in the sorted order
+        self.assertListEqual(sortedState.candList, resCandidates)
+        self.assertListEqual(sortedState.conList, resConflictCandidates)
+        self.assertListEqual(sortedState.candList, resCandList)
+        self.assertListEqual(sortedState.conList, resConList)
+        self.assertListEqual([desiredRAList[1], desiredRAList[3], desiredRAList[2], desiredRAList[0]], resCandList)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_whenScoringArraysProvided_createsSameCandAndConListsAsPython(self):
+        # Test to ensure that when the 'scoringArrays' parameter is provided, the
+        #  State Object's constructor creates the same candList and conList as
+        #  it does when scoring the RAs one at a time.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredDate = 20
+        desiredDay = Day(desiredDate, 4, isDoubleDay=True, flagDutySlot=True)
+        desiredLDATolerance = 5
+        desiredNDDTolerance = .1
+        desiredLastDateAssigned = {}
+        desiredNumDoubleDays = {}
+        desiredNumFlagDuties = {}
+        desiredRAList = [
+            RA("Test", "RA1", 1, 1, "2021-08-27", points=3),
+            RA("Test", "RA2", 2, 1, "2021-08-27", points=1),
+            RA("Test", "RA3", 3, 1, "2021-08-27", conflicts=[desiredDate], points=2),
+            RA("Test", "RA4", 4, 1, "2021-08-27", points=1),
+            RA("Test", "RA5", 5, 1, "2021-08-27", points=4),
+            RA("Test", "RA6", 6, 1, "2021-08-27", conflicts=[1, desiredDate], points=0)
+        ]
+
+        # Populate the lda, ndd, and nfd dictionaries
+        for i, ra in enumerate(desiredRAList):
+            desiredLastDateAssigned[ra] = [0, 17, 8, 0, 12, 3][i]
+            desiredNumDoubleDays[ra] = [1, 0, 2, 3, 0, 1][i]
+            desiredNumFlagDuties[ra] = [0, 1, 0, 2, 1, 0][i]
+
+        # Create the State object that scores the RAs one at a time
+        expectedState = State(
+            desiredDay,
+            desiredRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredLDATolerance,
+            desiredNDDTolerance,
+            desiredNumFlagDuties
+        )
+
+        # Create the ScoringArrays used in this test
+        desiredScoringArrays = State.ScoringArrays(
+            desiredRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredNumFlagDuties,
+            31
+        )
+
+        # -- Act --
+
+        # Create the State object being tested
+        testState = State(
+            desiredDay,
+            desiredRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredLDATolerance,
+            desiredNDDTolerance,
+            desiredNumFlagDuties,
+            scoringArrays=desiredScoringArrays
+        )
+
+        # -- Assert --
+
+        # Assert that the candList and conList are the same as when the RAs
+        #  are scored one at a time.
+        self.assertListEqual(expectedState.candList, testState.candList)
+        self.assertListEqual(expectedState.conList, testState.conList)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_whenScoringArraysProvidedWithSubsetOfRAs_onlyIncludesProvidedRAs(self):
+        # Test to ensure that when the 'scoringArrays' parameter is provided along
+        #  with only some of the RAs that the ScoringArrays were created with, the
+        #  State Object's constructor creates the same candList and conList as it
+        #  does when scoring the provided RAs one at a time.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredDate = 20
+        desiredDay = Day(desiredDate, 4, isDoubleDay=True, flagDutySlot=True)
+        desiredLDATolerance = 5
+        desiredNDDTolerance = .1
+        desiredLastDateAssigned = {}
+        desiredNumDoubleDays = {}
+        desiredNumFlagDuties = {}
+        desiredRAList = [
+            RA("Test", "RA1", 1, 1, "2021-08-27", points=3),
+            RA("Test", "RA2", 2, 1, "2021-08-27", points=1),
+            RA("Test", "RA3", 3, 1, "2021-08-27", conflicts=[desiredDate], points=2),
+            RA("Test", "RA4", 4, 1, "2021-08-27", points=1),
+            RA("Test", "RA5", 5, 1, "2021-08-27", points=4),
+            RA("Test", "RA6", 6, 1, "2021-08-27", conflicts=[1, desiredDate], points=0)
+        ]
+
+        # The RAs that are provided to the State objects
+        desiredSubsetRAList = [desiredRAList[0], desiredRAList[2], desiredRAList[3], desiredRAList[5]]
+
+        # Populate the lda, ndd, and nfd dictionaries
+        for i, ra in enumerate(desiredRAList):
+            desiredLastDateAssigned[ra] = [0, 17, 8, 0, 12, 3][i]
+            desiredNumDoubleDays[ra] = [1, 0, 2, 3, 0, 1][i]
+            desiredNumFlagDuties[ra] = [0, 1, 0, 2, 1, 0][i]
+
+        # Create the State object that scores the RAs one at a time
+        expectedState = State(
+            desiredDay,
+            desiredSubsetRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredLDATolerance,
+            desiredNDDTolerance,
+            desiredNumFlagDuties
+        )
+
+        # Create the ScoringArrays used in this test with all of the RAs
+        desiredScoringArrays = State.ScoringArrays(
+            desiredRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredNumFlagDuties,
+            31
+        )
+
+        # -- Act --
+
+        # Create the State object being tested
+        testState = State(
+            desiredDay,
+            desiredSubsetRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredLDATolerance,
+            desiredNDDTolerance,
+            desiredNumFlagDuties,
+            scoringArrays=desiredScoringArrays
+        )
+
+        # -- Assert --
+
+        # Assert that the candList and conList only contain the provided RAs
+        #  and are the same as when the RAs are scored one at a time.
+        self.assertListEqual(expectedState.candList, testState.candList)
+        self.assertListEqual(expectedState.conList, testState.conList)
+
     def test_magicMethodDeepcopy_createsDeepcopyOfStateObject(self):
         # Test to ensure that the __deepcopy__ magic method returns
         #  a pseudo deep copy of the State object.
@@ -1524,6 +1763,72 @@ class TestStateObject(unittest.TestCase):
         # Assert that the result is no longer in the testState's candList
         self.assertNotIn(res, testState.candList)
 
+    def test_peekNextCandidate_returnsFirstItemInCandList_withoutRemovingIt(self):
+        # Test to ensure that the peekNextCandidate method returns the
+        #  first item in the candList without removing the item from the list
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredDate = 27
+        singleDutyDay = Day(desiredDate, 1)
+        desiredLDATolerance = 15
+        desiredNDDTolerance = .141
+        desiredLastDateAssigned = {}
+        desiredNumDoubleDays = {}
+        desiredNumFlagDuties = {}
+        desiredRAList = [
+            # Candidate RAs
+            RA("Test", "RA1", 1, 1, "2021-08-27", points=2),
+            RA("Test", "RA2", 2, 1, "2021-08-27")
+        ]
+
+        # Populate the lda, ndd, and nfd dictionaries
+        for ra in desiredRAList:
+            desiredLastDateAssigned[ra] = 0
+            desiredNumDoubleDays[ra] = 0
+            desiredNumFlagDuties[ra] = 0
+
+        # Create the State objects being tested
+        testState = State(
+            singleDutyDay,
+            desiredRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredLDATolerance,
+            desiredNDDTolerance,
+            desiredNumFlagDuties
+        )
+        testLazyState = State(
+            singleDutyDay,
+            desiredRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredLDATolerance,
+            desiredNDDTolerance,
+            desiredNumFlagDuties,
+            lazyCandidates=True
+        )
+
+        preTestCandList = testState.candList.copy()
+
+        # -- Act --
+
+        # Call the method being tested
+        res = testState.peekNextCandidate()
+        resLazy = testLazyState.peekNextCandidate()
+
+        # -- Assert --
+
+        # Assert that the results were the first item in the preTestCandList
+        self.assertEqual(preTestCandList[0], res)
+        self.assertEqual(preTestCandList[0], resLazy)
+        self.assertEqual(desiredRAList[1], res)
+
+        # Assert that the result is still the next candidate
+        self.assertListEqual(preTestCandList, testState.candList)
+        self.assertEqual(res, testLazyState.getNextCandidate())
+
     def test_assignNextRA_returnsAssignedRA(self):
         # Test to ensure that the assignNextRA method returns the RA
         #  that was assigned for duty to the calling method.
@@ -1731,6 +2036,201 @@ class TestStateObject(unittest.TestCase):
         self.assertEqual(desiredNumFlagDuties[expectedAssignedRA], 1)
         self.assertEqual(desiredNumFlagDuties[testState.candList[0]], 0)
 
+    def test_undoAssignments_restoresCountersAndRemovesAssignedRA(self):
+        # Test to ensure that the undoAssignments method reverts the assignment
+        #  made by assignNextRA, restoring the lastDateAssigned, numDoubleDays
+        #  and numFlagDuties dictionaries and the RA's points in place.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredDate = 27
+        desiredPrevDate = 12
+        flaggedDoubleDay = Day(desiredDate, 1, customPointVal=2, isDoubleDay=True, flagDutySlot=True)
+        desiredLDATolerance = 15
+        desiredNDDTolerance = .141
+        desiredLastDateAssigned = {}
+        desiredNumDoubleDays = {}
+        desiredNumFlagDuties = {}
+        desiredRAList = [
+            RA("Test", "RA1", 1, 1, "2021-08-27", points=3),
+            RA("Test", "RA2", 2, 1, "2021-08-27", points=3)
+        ]
+
+        # Populate the lda, ndd, and nfd dictionaries
+        for ra in desiredRAList:
+            desiredLastDateAssigned[ra] = desiredPrevDate
+            desiredNumDoubleDays[ra] = 1
+            desiredNumFlagDuties[ra] = 1
+
+        # Create the State object being tested
+        testState = State(
+            flaggedDoubleDay,
+            desiredRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredLDATolerance,
+            desiredNDDTolerance,
+            desiredNumFlagDuties
+        )
+
+        # Assign the next RA for duty
+        assignedRA = testState.assignNextRA()
+
+        # -- Act --
+
+        # Call the method being tested.
+        testState.undoAssignments()
+
+        # -- Assert --
+
+        # Assert that the RA is no longer on duty and that their points were removed
+        self.assertEqual(flaggedDoubleDay.numberOnDuty(), 0)
+        self.assertEqual(assignedRA.getPoints(), 3)
+
+        # Assert that the dictionaries were restored in place
+        self.assertEqual(desiredLastDateAssigned[assignedRA], desiredPrevDate)
+        self.assertEqual(desiredNumDoubleDays[assignedRA], 1)
+        self.assertEqual(desiredNumFlagDuties[assignedRA], 1)
+
+        # Assert that there is nothing left to undo
+        self.assertFalse(testState.hasUndoableAssignments())
+
+    def test_hasUndoableAssignments_returnsTrueIfAndOnlyIfAnAssignmentHasBeenMade(self):
+        # Test to ensure that the hasUndoableAssignments method returns True if and
+        #  only if the State has made an assignment that has not yet been undone.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredDate = 27
+        singleDutyDay = Day(desiredDate, 1)
+        desiredLDATolerance = 15
+        desiredNDDTolerance = .141
+        desiredLastDateAssigned = {}
+        desiredNumDoubleDays = {}
+        desiredNumFlagDuties = {}
+        desiredRAList = [
+            RA("Test", "RA1", 1, 1, "2021-08-27"),
+            RA("Test", "RA2", 2, 1, "2021-08-27")
+        ]
+
+        # Populate the lda, ndd, and nfd dictionaries
+        for ra in desiredRAList:
+            desiredLastDateAssigned[ra] = 0
+            desiredNumDoubleDays[ra] = 0
+            desiredNumFlagDuties[ra] = 0
+
+        # Create the State object being tested
+        testState = State(
+            singleDutyDay,
+            desiredRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredLDATolerance,
+            desiredNDDTolerance,
+            desiredNumFlagDuties
+        )
+
+        # -- Act --
+
+        # Check the state before and after an assignment is made
+        resBefore = testState.hasUndoableAssignments()
+        testState.assignNextRA()
+        resAfter = testState.hasUndoableAssignments()
+
+        # -- Assert --
+
+        # Assert that we received the expected results
+        self.assertFalse(resBefore)
+        self.assertTrue(resAfter)
+
+    def test_RunningTotalsObject_calculatesAveragesFromProvidedValues(self):
+        # Test to ensure that the RunningTotals object calculates the average
+        #  number of points, double-day duties and flagged duties amongst the
+        #  provided RAs.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredRAList = [
+            RA("Test", "RA1", 1, 1, "2021-08-27", points=2),
+            RA("Test", "RA2", 2, 1, "2021-08-27", points=7)
+        ]
+        desiredNumDoubleDays = {desiredRAList[0]: 1, desiredRAList[1]: 2}
+        desiredNumFlagDuties = {desiredRAList[0]: 0, desiredRAList[1]: 1}
+
+        # -- Act --
+
+        # Create the RunningTotals object being tested
+        testTotals = State.RunningTotals(desiredRAList, desiredNumDoubleDays, desiredNumFlagDuties)
+
+        # -- Assert --
+
+        # Assert that the averages are as we expect
+        self.assertEqual(testTotals.getPointsAvg(), 4.5)
+        self.assertEqual(testTotals.getDoubleDayAvg(), 1.5)
+        self.assertEqual(testTotals.getFlagDutyAvg(), 0.5)
+
+    def test_assignNextRA_withRunningTotals_updatesAndRevertsRunningTotals(self):
+        # Test to ensure that when a State Object is provided a RunningTotals
+        #  object, assigning an RA updates the totals and undoing the assignment
+        #  reverts them.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredDate = 27
+        flaggedDoubleDay = Day(desiredDate, 1, customPointVal=2, isDoubleDay=True, flagDutySlot=True)
+        desiredLDATolerance = 15
+        desiredNDDTolerance = .141
+        desiredLastDateAssigned = {}
+        desiredNumDoubleDays = {}
+        desiredNumFlagDuties = {}
+        desiredRAList = [
+            RA("Test", "RA1", 1, 1, "2021-08-27", points=1),
+            RA("Test", "RA2", 2, 1, "2021-08-27", points=3)
+        ]
+
+        # Populate the lda, ndd, and nfd dictionaries
+        for ra in desiredRAList:
+            desiredLastDateAssigned[ra] = 0
+            desiredNumDoubleDays[ra] = 0
+            desiredNumFlagDuties[ra] = 0
+
+        # Create the RunningTotals object to be shared with the State
+        desiredTotals = State.RunningTotals(desiredRAList, desiredNumDoubleDays, desiredNumFlagDuties)
+
+        # Create the State object being tested
+        testState = State(
+            flaggedDoubleDay,
+            desiredRAList,
+            desiredLastDateAssigned,
+            desiredNumDoubleDays,
+            desiredLDATolerance,
+            desiredNDDTolerance,
+            desiredNumFlagDuties,
+            runningTotals=desiredTotals
+        )
+
+        # -- Act --
+
+        # Assign an RA and record the averages
+        testState.assignNextRA()
+        resAssignedAvgs = (desiredTotals.getPointsAvg(), desiredTotals.getDoubleDayAvg(),
+                           desiredTotals.getFlagDutyAvg())
+
+        # Undo the assignment and record the averages
+        testState.undoAssignments()
+        resRevertedAvgs = (desiredTotals.getPointsAvg(), desiredTotals.getDoubleDayAvg(),
+                           desiredTotals.getFlagDutyAvg())
+
+        # -- Assert --
+
+        # Assert that the totals were updated and then reverted
+        self.assertTupleEqual(resAssignedAvgs, (3.0, 0.5, 0.5))
+        self.assertTupleEqual(resRevertedAvgs, (2.0, 0.0, 0.0))
+
     def test_assignNextRA_assignsNextRAToCurDay(self):
         # -- Arrange --
         # -- Act --
@@ -393,6 +393,12 @@ class TestSchedule_deleteDuty(unittest.TestCase):
             (expectedRAID, self.user_hall_id, expectedDayID, expectedScheduleID)
         )
 
+        # Assert that the schedule's fingerprint was cleared so that the edited
+        #  schedule is not reused by the scheduler's result cache
+        self.mocked_appGlobals.conn.cursor().execute.assert_any_call(
+            "UPDATE schedule SET fingerprint = NULL WHERE id = %s;", (expectedScheduleID,)
+        )
+
         # Assert that we received the expected response
         self.assertEqual(resp.json, stdRet(1, "successful"))
 
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
-from helperFunctions.helperFunctions import AuthenticatedUser
+from helperFunctions.helperFunctions import AuthenticatedUser, stdRet
 from scheduleServer import app
 
 
@@ -212,3 +212,57 @@ class TestSchedule_runScheduler(unittest.TestCase):
         # -- Act --
         # -- Assert --
         pass
+
+    @patch("schedule.schedule.schedulerQueueConn", autospec=True)
+    def test_withAuthorizedUser_withBrokenQueueConnection_marksRequestAsFailed(self, mocked_schedulerQueueConn):
+        # Test to ensure that when the scheduler request cannot be published to the
+        #  message broker, the scheduler_queue record that was created for it is
+        #  marked as failed so that it does not supersede older requests for the
+        #  same month.
+
+        # -- Arrange --
+
+        # Reset all of the mocked objects that will be used in this test
+        self.mocked_authLevel.reset_mock()
+        self.mocked_appGlobals.conn.reset_mock()
+
+        # Set the auth_level of this session to 2
+        self.mocked_authLevel.return_value = 2
+
+        # Generate the various objects that will be used in this test
+        desiredSQID = 17
+        desiredMonthNum = 3
+        desiredYear = 2021
+
+        # Configure the appGlobals.conn.cursor.fetchone mock to return the new record
+        self.mocked_appGlobals.conn.cursor().fetchone.return_value = (desiredSQID, MagicMock(), 0)
+
+        # Configure the schedulerQueueConn to fail to publish the message
+        mocked_schedulerQueueConn.publishMsg.return_value = False
+
+        # -- Act --
+
+        # Make a request to the desired API endpoint
+        resp = self.server.post("/schedule/api/runScheduler",
+                                json=dict(
+                                    monthNum=desiredMonthNum,
+                                    year=desiredYear,
+                                    noDuty="",
+                                    eligibleRAs=""
+                                ),
+                                base_url=self.mocked_appGlobals.baseOpts["HOST_URL"])
+
+        # -- Assert --
+
+        # Assert that the last time appGlobals.conn.cursor().execute was called,
+        #  the scheduler_queue record was marked as failed.
+        self.mocked_appGlobals.conn.cursor().execute.assert_called_with(
+            "UPDATE scheduler_queue SET status = %s, reason = %s WHERE id = %s;",
+            (-2, "Unable to queue scheduler request.", desiredSQID)
+        )
+
+        # Assert that the changes were committed
+        self.assertEqual(self.mocked_appGlobals.conn.commit.call_count, 2)
+
+        # Assert that we received the expected response
+        self.assertEqual(resp.json, stdRet(-1, "Connection to message broker interrupted. Please try again."))
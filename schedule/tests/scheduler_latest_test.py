@@ -1,7 +1,9 @@
 from schedule.scheduler4_0 import schedule
-from schedule.ra_sched import Schedule, RA
+from schedule.ra_sched import Schedule, RA, np
+from schedule import scheduler4_3, scheduler5_0
 from unittest.mock import MagicMock, patch
 from datetime import date
+import copy as cp
 import unittest
 import random
 
@@ -30,6 +32,31 @@ class TestScheduler(unittest.TestCase):
         self.patcher_loggingCRITICAL.stop()
         self.patcher_loggingERROR.stop()
 
+    def assertScheduleIsValid(self, result, raList, ldaTolerance):
+        # This function serves to assert that the provided Schedule object is
+        #  complete, does not schedule any RA on a date they have a conflict
+        #  with or twice on the same date, and keeps each RA's duties at least
+        #  the ldaTolerance apart.
+        self.assertEqual(Schedule.SUCCESS, result.getStatus())
+
+        raConflicts = {ra.getId(): set(ra.getConflicts()) for ra in raList}
+        datesAssigned = {}
+        for day in result:
+            raIds = [ra.getId() for ra in day.getRAs()]
+
+            # Assert that every duty on this date is filled by a different RA
+            self.assertEqual(day.numberDutySlots(), day.numberOnDuty())
+            self.assertEqual(len(raIds), len(set(raIds)))
+
+            for raId in raIds:
+                self.assertNotIn(day.getDate(), raConflicts[raId])
+                datesAssigned.setdefault(raId, []).append(day.getDate())
+
+        for raDates in datesAssigned.values():
+            raDates.sort()
+            for prevDate, nextDate in zip(raDates, raDates[1:]):
+                self.assertGreaterEqual(nextDate - prevDate, ldaTolerance)
+
     def test_scheduler_whenUnableToGenerateSchedule_returnsEmptyList(self):
         # -- Arrange --
         # -- Act --
@@ -66,6 +93,541 @@ class TestScheduler(unittest.TestCase):
         # -- Assert --
         pass
 
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_scheduler4_3_withVectorizedScoringAndSlotCombinations_respectsLDATolerance(self):
+        # Test to ensure that when the scheduler combines the duty slots of double
+        #  days while scoring the candidates with NumPy arrays, none of the RAs are
+        #  scheduled more often than the LDA tolerance allows.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredYear = 2021
+        desiredMonth = 10
+        desiredLDATolerance = 7
+        rand = random.Random(2)
+        desiredRAList = [
+            RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1),
+               conflicts=rand.sample(range(1, 32), rand.randint(0, 6)), points=rand.randint(0, 5))
+            for i in range(14)
+        ]
+
+        # -- Act --
+
+        # Run the scheduler with the vectorized scoring and slot combinations
+        result = scheduler4_3.schedule(
+            desiredRAList, desiredYear, desiredMonth, ldaTolerance=desiredLDATolerance,
+            doubleDates=set(), timeout=10, useUndoTrail=True,
+            useVectorizedScoring=True, useSlotCombinations=True
+        )
+
+        # Collect the dates that each RA was scheduled for
+        datesAssigned = {}
+        for day in result:
+            for ra in day.getRAs():
+                datesAssigned.setdefault(ra.getId(), []).append(day.getDate())
+
+        # -- Assert --
+
+        # Assert that a schedule was generated
+        self.assertEqual(Schedule.SUCCESS, result.getStatus())
+
+        # Assert that every RA's duties are at least the LDA tolerance apart
+        for raDates in datesAssigned.values():
+            raDates.sort()
+            for prevDate, nextDate in zip(raDates, raDates[1:]):
+                self.assertGreaterEqual(nextDate - prevDate, desiredLDATolerance)
+
+    def test_scheduler4_3_withForwardCheckingAndAnytimeScheduling_whenBudgetReached_returnsPartialSchedule(self):
+        # Test to ensure that when the forward checking search runs out of nodes
+        #  with anytime scheduling enabled, the scheduler returns a partial
+        #  schedule that respects the LDA tolerance rather than a failed one.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredYear = 2021
+        desiredMonth = 10
+        desiredLDATolerance = 6
+        rand = random.Random(4)
+        desiredRAList = [
+            RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1),
+               conflicts=rand.sample(range(1, 32), rand.randint(0, 10)), points=rand.randint(0, 5))
+            for i in range(10)
+        ]
+
+        # -- Act --
+
+        # Run the scheduler with a node budget that is too small to finish
+        result = scheduler4_3.schedule(
+            desiredRAList, desiredYear, desiredMonth, ldaTolerance=desiredLDATolerance,
+            doubleDates=set(), timeout=10, nodeBudget=50, useForwardChecking=True,
+            useBackjumping=True, useAnytimeScheduling=True
+        )
+
+        # Collect the dates that each RA was scheduled for
+        datesAssigned = {}
+        for day in result:
+            for ra in day.getRAs():
+                datesAssigned.setdefault(ra.getId(), []).append(day.getDate())
+
+        # -- Assert --
+
+        # Assert that a partial schedule was generated
+        self.assertEqual(Schedule.WARNING, result.getStatus())
+        self.assertGreater(len(datesAssigned), 0)
+
+        # Assert that every RA's duties are at least the LDA tolerance apart
+        for raDates in datesAssigned.values():
+            raDates.sort()
+            for prevDate, nextDate in zip(raDates, raDates[1:]):
+                self.assertGreaterEqual(nextDate - prevDate, desiredLDATolerance)
+
+    def test_scheduler4_3_whenBudgetReached_marksFailedScheduleAsBudgetExhausted(self):
+        # Test to ensure that when the search runs out of nodes, the failed
+        #  schedule is marked as budget exhausted so that it is not mistaken
+        #  for a proven failure, while a completed search is not marked.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredYear = 2021
+        desiredMonth = 10
+        rand = random.Random(4)
+        desiredRAList = [
+            RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1),
+               conflicts=rand.sample(range(1, 32), rand.randint(0, 10)), points=rand.randint(0, 5))
+            for i in range(10)
+        ]
+
+        # -- Act --
+
+        # Run each search with a node budget that is too small to finish
+        budgetResults = [
+            scheduler4_3.schedule(
+                desiredRAList, desiredYear, desiredMonth, ldaTolerance=6, doubleDates=set(),
+                timeout=10, nodeBudget=5, useForwardChecking=useForwardChecking
+            )
+            for useForwardChecking in (True, False)
+        ]
+
+        # Run the scheduler with enough of a budget to finish
+        finishedResult = scheduler4_3.schedule(
+            desiredRAList, desiredYear, desiredMonth, ldaTolerance=2, doubleDates=set(), timeout=10
+        )
+
+        # -- Assert --
+
+        # Assert that the searches that ran out of nodes are marked
+        for result in budgetResults:
+            self.assertEqual(Schedule.FAIL, result.getStatus())
+            self.assertEqual(1, result.getStats()["budgetExhausted"])
+
+        # Assert that the search that finished is not marked
+        self.assertEqual(Schedule.SUCCESS, finishedResult.getStatus())
+        self.assertEqual(0, finishedResult.getStats()["budgetExhausted"])
+
+    def test_scheduler4_3_withForwardChecking_whenSolvable_returnsValidSchedule(self):
+        # Test to ensure that when the forward checking search is used on inputs
+        #  that can be scheduled, every duty in the month is filled without
+        #  scheduling any RA on a date they have a conflict with or more often
+        #  than the LDA tolerance allows.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredYear = 2021
+        desiredMonth = 10
+        desiredLDATolerance = 6
+        rand = random.Random(0)
+        desiredRAList = [
+            RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1),
+               conflicts=rand.sample(range(1, 32), rand.randint(0, 8)), points=rand.randint(0, 5))
+            for i in range(12)
+        ]
+
+        # -- Act --
+
+        # Run the scheduler with forward checking
+        result = scheduler4_3.schedule(
+            desiredRAList, desiredYear, desiredMonth, ldaTolerance=desiredLDATolerance,
+            doubleDates=set(), timeout=10, useForwardChecking=True
+        )
+
+        # -- Assert --
+
+        # Assert that a complete and valid schedule was generated
+        self.assertScheduleIsValid(result, desiredRAList, desiredLDATolerance)
+        self.assertEqual(31, len(result))
+
+    def test_scheduler4_3_withBackjumping_whenSolvable_returnsSameScheduleAsForwardChecking(self):
+        # Test to ensure that when backjumping is used on inputs that can be
+        #  scheduled, it generates the same schedule as plain forward checking.
+        #  Backjumping only skips assignments that cannot lead to a schedule,
+        #  so the first schedule found should not change.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredYear = 2021
+        desiredMonth = 10
+        desiredLDATolerance = 5
+        rand = random.Random(0)
+        desiredRAList = [
+            RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1),
+               conflicts=rand.sample(range(1, 32), rand.randint(0, 8)), points=rand.randint(0, 5))
+            for i in range(12)
+        ]
+
+        # -- Act --
+
+        # Run the scheduler with plain forward checking and with backjumping. Each
+        #  run is given its own copy of the RAs since the scheduler updates their
+        #  points.
+        fcResult, bjResult = [
+            scheduler4_3.schedule(
+                cp.deepcopy(desiredRAList), desiredYear, desiredMonth, ldaTolerance=desiredLDATolerance,
+                doubleDates=set(), timeout=10, useForwardChecking=True, useBackjumping=useBackjumping
+            )
+            for useBackjumping in (False, True)
+        ]
+
+        # -- Assert --
+
+        # Assert that the search had to backtrack to find the schedule
+        self.assertGreater(fcResult.getStats()["backtracks"], 0)
+
+        # Assert that both searches generated a complete and valid schedule
+        self.assertScheduleIsValid(fcResult, desiredRAList, desiredLDATolerance)
+        self.assertScheduleIsValid(bjResult, desiredRAList, desiredLDATolerance)
+
+        # Assert that both searches generated the same schedule
+        self.assertEqual(
+            [(day.getDate(), sorted(ra.getId() for ra in day.getRAs())) for day in fcResult],
+            [(day.getDate(), sorted(ra.getId() for ra in day.getRAs())) for day in bjResult]
+        )
+
+    def test_scheduler4_3_withBackjumping_whenUnsolvable_fails(self):
+        # Test to ensure that when backjumping is used on inputs that cannot be
+        #  scheduled, the search fails once it has ruled out every assignment,
+        #  just like the calendar order and plain forward checking searches.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredYear = 2021
+        desiredMonth = 10
+        desiredLDATolerance = 5
+        rand = random.Random(27)
+        desiredRAList = [
+            RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1),
+               conflicts=rand.sample(range(1, 32), rand.randint(0, 8)), points=rand.randint(0, 5))
+            for i in range(7)
+        ]
+
+        # -- Act --
+
+        # Run the scheduler with each of the searches using a copy of the RAs
+        calendarResult, fcResult, bjResult = [
+            scheduler4_3.schedule(
+                cp.deepcopy(desiredRAList), desiredYear, desiredMonth, ldaTolerance=desiredLDATolerance,
+                doubleDates=set(), timeout=10, **searchArgs
+            )
+            for searchArgs in ({}, {"useForwardChecking": True}, {"useForwardChecking": True, "useBackjumping": True})
+        ]
+
+        # -- Assert --
+
+        # Assert that each search ran and failed without running out of time or nodes
+        for result in (calendarResult, fcResult, bjResult):
+            self.assertEqual(Schedule.FAIL, result.getStatus())
+            self.assertGreater(result.getStats()["nodes"], 0)
+            self.assertEqual(0, result.getStats()["budgetExhausted"])
+
+        # Assert that backjumping skipped part of the search
+        self.assertLess(bjResult.getStats()["nodes"], fcResult.getStats()["nodes"])
+
+    def test_scheduler4_3_withNogoodCache_whenSolvable_returnsValidSchedule(self):
+        # Test to ensure that when the nogood cache skips states that have already
+        #  failed on inputs that can be scheduled, the scheduler still generates
+        #  a complete and valid schedule just like the search without the cache.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredYear = 2021
+        desiredMonth = 10
+        desiredLDATolerance = 6
+        rand = random.Random(13)
+        desiredRAList = [
+            RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1),
+               conflicts=rand.sample(range(1, 32), rand.randint(0, 8)), points=rand.randint(0, 5))
+            for i in range(12)
+        ]
+
+        # -- Act --
+
+        # Run the scheduler without and with the nogood cache using a copy of the RAs
+        baseResult, nogoodResult = [
+            scheduler4_3.schedule(
+                cp.deepcopy(desiredRAList), desiredYear, desiredMonth, ldaTolerance=desiredLDATolerance,
+                doubleDates=set(), timeout=10, useUndoTrail=True, nogoodCacheSize=nogoodCacheSize
+            )
+            for nogoodCacheSize in (0, 1000)
+        ]
+
+        # -- Assert --
+
+        # Assert that both searches generated a complete and valid schedule
+        self.assertScheduleIsValid(baseResult, desiredRAList, desiredLDATolerance)
+        self.assertScheduleIsValid(nogoodResult, desiredRAList, desiredLDATolerance)
+
+        # Assert that the nogood cache skipped part of the search
+        self.assertGreater(nogoodResult.getStats()["nogoodHits"], 0)
+
+    def test_scheduler4_3_withNogoodCache_whenUnsolvable_fails(self):
+        # Test to ensure that when the nogood cache is used on inputs that cannot
+        #  be scheduled, the search fails once it has ruled out every assignment
+        #  just like the search without the cache.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredYear = 2021
+        desiredMonth = 10
+        desiredLDATolerance = 5
+        rand = random.Random(1)
+        desiredRAList = [
+            RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1),
+               conflicts=rand.sample(range(1, 32), rand.randint(0, 8)), points=rand.randint(0, 5))
+            for i in range(7)
+        ]
+
+        # -- Act --
+
+        # Run the scheduler without and with the nogood cache using a copy of the RAs
+        baseResult, nogoodResult = [
+            scheduler4_3.schedule(
+                cp.deepcopy(desiredRAList), desiredYear, desiredMonth, ldaTolerance=desiredLDATolerance,
+                doubleDates=set(), timeout=10, useUndoTrail=True, nogoodCacheSize=nogoodCacheSize
+            )
+            for nogoodCacheSize in (0, 1000)
+        ]
+
+        # -- Assert --
+
+        # Assert that both searches ran and failed without running out of time or nodes
+        for result in (baseResult, nogoodResult):
+            self.assertEqual(Schedule.FAIL, result.getStatus())
+            self.assertGreater(result.getStats()["nodes"], 0)
+            self.assertEqual(0, result.getStats()["budgetExhausted"])
+
+        # Assert that the nogood cache skipped part of the search
+        self.assertGreater(nogoodResult.getStats()["nogoodHits"], 0)
+        self.assertLess(nogoodResult.getStats()["nodes"], baseResult.getStats()["nodes"])
+
+    def test_scheduler4_3_withSymmetryBreaking_whenSolvable_returnsValidSchedule(self):
+        # Test to ensure that when symmetry breaking skips RAs that are
+        #  interchangeable with an RA that was already tried on inputs that can
+        #  be scheduled, the scheduler still generates a complete and valid
+        #  schedule just like the search without symmetry breaking.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredYear = 2021
+        desiredMonth = 10
+        desiredLDATolerance = 6
+        rand = random.Random(13)
+        desiredRAList = [
+            RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1),
+               conflicts=rand.sample(range(1, 32), rand.randint(0, 8)), points=rand.randint(0, 5))
+            for i in range(12)
+        ]
+
+        # -- Act --
+
+        # Run the scheduler without and with symmetry breaking using a copy of the RAs
+        baseResult, symmetryResult = [
+            scheduler4_3.schedule(
+                cp.deepcopy(desiredRAList), desiredYear, desiredMonth, ldaTolerance=desiredLDATolerance,
+                doubleDates=set(), timeout=10, useUndoTrail=True, useSymmetryBreaking=useSymmetryBreaking
+            )
+            for useSymmetryBreaking in (False, True)
+        ]
+
+        # -- Assert --
+
+        # Assert that both searches generated a complete and valid schedule
+        self.assertScheduleIsValid(baseResult, desiredRAList, desiredLDATolerance)
+        self.assertScheduleIsValid(symmetryResult, desiredRAList, desiredLDATolerance)
+
+        # Assert that symmetry breaking skipped part of the search
+        self.assertGreater(symmetryResult.getStats()["symmetrySkips"], 0)
+
+    def test_scheduler4_3_withSymmetryBreaking_whenUnsolvable_fails(self):
+        # Test to ensure that when symmetry breaking is used on inputs that
+        #  cannot be scheduled, the search fails once it has ruled out every
+        #  assignment just like the search without symmetry breaking.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredYear = 2021
+        desiredMonth = 10
+        desiredLDATolerance = 5
+        rand = random.Random(1)
+        desiredRAList = [
+            RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1),
+               conflicts=rand.sample(range(1, 32), rand.randint(0, 8)), points=rand.randint(0, 5))
+            for i in range(7)
+        ]
+
+        # -- Act --
+
+        # Run the scheduler without and with symmetry breaking using a copy of the RAs
+        baseResult, symmetryResult = [
+            scheduler4_3.schedule(
+                cp.deepcopy(desiredRAList), desiredYear, desiredMonth, ldaTolerance=desiredLDATolerance,
+                doubleDates=set(), timeout=10, useUndoTrail=True, useSymmetryBreaking=useSymmetryBreaking
+            )
+            for useSymmetryBreaking in (False, True)
+        ]
+
+        # -- Assert --
+
+        # Assert that both searches ran and failed without running out of time or nodes
+        for result in (baseResult, symmetryResult):
+            self.assertEqual(Schedule.FAIL, result.getStatus())
+            self.assertGreater(result.getStats()["nodes"], 0)
+            self.assertEqual(0, result.getStats()["budgetExhausted"])
+
+        # Assert that symmetry breaking skipped part of the search
+        self.assertGreater(symmetryResult.getStats()["symmetrySkips"], 0)
+        self.assertLess(symmetryResult.getStats()["nodes"], baseResult.getStats()["nodes"])
+
+    def test_scheduler4_3_whenDutySlotsCanBeCovered_startsSearch(self):
+        # Test to ensure that when there are exactly enough RAs to cover every
+        #  window of ldaTolerance dates, the slot coverage check passes and the
+        #  search generates a schedule.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredLDATolerance = 4
+        desiredRAList = [RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1)) for i in range(desiredLDATolerance)]
+
+        # -- Act --
+
+        # Run the scheduler with one duty on each date
+        result = scheduler4_3.schedule(
+            desiredRAList, 2021, 10, ldaTolerance=desiredLDATolerance,
+            doubleDays=(), doubleDates=set(), timeout=10
+        )
+
+        # -- Assert --
+
+        # Assert that the search was started and generated a schedule
+        self.assertEqual(Schedule.SUCCESS, result.getStatus())
+        self.assertGreater(result.getStats()["nodes"], 0)
+        self.assertEqual(31, len(result))
+
+    def test_scheduler4_3_whenTooFewRAsToCoverDutySlots_failsWithoutSearching(self):
+        # Test to ensure that when there are fewer RAs than duty slots within a
+        #  window of ldaTolerance dates, Hall's condition fails and the scheduler
+        #  reports the dates of that window without starting the search.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredLDATolerance = 4
+        desiredRAList = [RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1)) for i in range(desiredLDATolerance - 1)]
+
+        # -- Act --
+
+        # Run the scheduler with one duty on each date
+        result = scheduler4_3.schedule(
+            desiredRAList, 2021, 10, ldaTolerance=desiredLDATolerance,
+            doubleDays=(), doubleDates=set(), timeout=10
+        )
+
+        # -- Assert --
+
+        # Assert that the search was never started
+        self.assertEqual(Schedule.FAIL, result.getStatus())
+        self.assertEqual(0, result.getStats()["nodes"])
+
+        # Assert that the dates of the first window were reported
+        self.assertEqual(
+            [Schedule.Note(
+                "A schedule could not be generated because there are not enough available RAs to "
+                "cover the duties on the following day(s): 1, 2, 3, 4",
+                Schedule.FAIL
+            )],
+            result.getNotes()
+        )
+
+    def test_scheduler5_0_whenDutySlotsCanBeCovered_startsSearch(self):
+        # Test to ensure that when there are exactly enough RAs to cover every
+        #  window of ldaTolerance dates, the slot coverage check passes and the
+        #  search is started with the first state.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredLDATolerance = 4
+        desiredRAList = [RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1)) for i in range(desiredLDATolerance)]
+
+        # Create a patcher for the State object so that we can tell when the
+        #  search is started
+        class SearchStarted(Exception):
+            pass
+
+        with patch("schedule.scheduler5_0.State", autospec=True, side_effect=SearchStarted) as mocked_State:
+
+            # -- Act --
+
+            # Run the scheduler with one duty on each date
+            with self.assertRaises(SearchStarted):
+                scheduler5_0.schedule(
+                    desiredRAList, 2021, 10, ldaTolerance=desiredLDATolerance,
+                    doubleDays=(), doubleDates=set()
+                )
+
+        # -- Assert --
+
+        # Assert that the first state of the search was created
+        mocked_State.assert_called_once()
+
+    def test_scheduler5_0_whenTooFewRAsToCoverDutySlots_failsWithoutSearching(self):
+        # Test to ensure that when there are fewer RAs than duty slots within a
+        #  window of ldaTolerance dates, Hall's condition fails and the scheduler
+        #  returns without starting the search.
+
+        # -- Arrange --
+
+        # Create the objects used in this test
+        desiredLDATolerance = 4
+        desiredRAList = [RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1)) for i in range(desiredLDATolerance - 1)]
+
+        with patch("schedule.scheduler5_0.State", autospec=True) as mocked_State:
+
+            # -- Act --
+
+            # Run the scheduler with one duty on each date
+            result = scheduler5_0.schedule(
+                desiredRAList, 2021, 10, ldaTolerance=desiredLDATolerance,
+                doubleDays=(), doubleDates=set()
+            )
+
+        # -- Assert --
+
+        # Assert that no schedule or furthest state was returned
+        self.assertEqual(([], None), result)
+
+        # Assert that the search was never started
+        mocked_State.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,222 @@
+from schedule.ra_sched import Schedule
+from unittest.mock import MagicMock, patch
+import schedulerProcess
+import unittest
+
+
+class TestSchedulerProcess_getAdaptiveSchedulerBudget(unittest.TestCase):
+    def setUp(self):
+        # Set up a number of items that will be used for these tests.
+
+        # -- Mock the os.environ method so that the budget settings are known --
+
+        # Helper Dict for holding the os.environ configuration
+        self.helper_osEnviron = {
+            "SCHEDULER_ADAPTIVE_BUDGET_MARGIN": "2",
+            "SCHEDULER_ADAPTIVE_MAX_TIMEOUT": "30",
+            "SCHEDULER_NODE_BUDGET": "200000"
+        }
+
+        # Create a dictionary patcher for the os.environ method
+        self.patcher_osEnviron = patch.dict("os.environ", self.helper_osEnviron)
+
+        # Start the os patchers (No mock object is returned since we used patch.dict())
+        self.patcher_osEnviron.start()
+
+        # -- Create a cursor for the run history to be loaded from --
+        self.mocked_cursor = MagicMock()
+
+        # Set the values that are used throughout
+        self.helper_resHallID = 1
+        self.helper_numRAs = 10
+
+        # -- Create a patchers for the logging --
+        self.patcher_loggingDEBUG = patch("logging.debug", autospec=True)
+        self.patcher_loggingINFO = patch("logging.info", autospec=True)
+        self.patcher_loggingWARNING = patch("logging.warning", autospec=True)
+        self.patcher_loggingCRITICAL = patch("logging.critical", autospec=True)
+        self.patcher_loggingERROR = patch("logging.error", autospec=True)
+
+        # Start the patcher - mock returned
+        self.mocked_loggingDEBUG = self.patcher_loggingDEBUG.start()
+        self.mocked_loggingINFO = self.patcher_loggingINFO.start()
+        self.mocked_loggingWARNING = self.patcher_loggingWARNING.start()
+        self.mocked_loggingCRITICAL = self.patcher_loggingCRITICAL.start()
+        self.mocked_loggingERROR = self.patcher_loggingERROR.start()
+
+    def tearDown(self):
+        # Stop all of the patchers
+        self.patcher_osEnviron.stop()
+
+        # Stop all of the logging patchers
+        self.patcher_loggingDEBUG.stop()
+        self.patcher_loggingINFO.stop()
+        self.patcher_loggingWARNING.stop()
+        self.patcher_loggingCRITICAL.stop()
+        self.patcher_loggingERROR.stop()
+
+    def test_withTooFewRuns_returnsNone(self):
+        # Test to ensure that when the hall does not have enough runs in its
+        #  history, no budget is derived so that the configured budget is used.
+
+        # -- Arrange --
+
+        # Configure the cursor to return one run less than is required
+        self.mocked_cursor.fetchone.return_value = (schedulerProcess.ADAPTIVE_BUDGET_MIN_SAMPLES - 1, 1.0, 5000)
+
+        # -- Act --
+
+        # Derive the budget
+        result = schedulerProcess.getAdaptiveSchedulerBudget(
+            self.mocked_cursor, self.helper_resHallID, self.helper_numRAs
+        )
+
+        # -- Assert --
+
+        # Assert that no budget was derived
+        self.assertIsNone(result)
+
+    def test_withEnoughRuns_returnsPercentileMultipliedByMargin(self):
+        # Test to ensure that when the hall has enough runs in its history, the
+        #  timeout and node budget are the 95th percentiles of those runs
+        #  multiplied by the SCHEDULER_ADAPTIVE_BUDGET_MARGIN.
+
+        # -- Arrange --
+
+        # Configure the cursor to return the percentiles of the runs
+        self.mocked_cursor.fetchone.return_value = (20, 1.5, 5000)
+
+        # -- Act --
+
+        # Derive the budget
+        result = schedulerProcess.getAdaptiveSchedulerBudget(
+            self.mocked_cursor, self.helper_resHallID, self.helper_numRAs
+        )
+
+        # -- Assert --
+
+        # Assert that the budget is the percentiles multiplied by the margin
+        self.assertEqual((3.0, 10000), result)
+
+    def test_withEnoughRuns_includesRunsThatRanOutOfBudget(self):
+        # Test to ensure that the runs that ran out of budget are loaded along
+        #  with the successful runs so that the budget is able to grow.
+
+        # -- Arrange --
+
+        # Configure the cursor to return the percentiles of the runs
+        self.mocked_cursor.fetchone.return_value = (20, 1.5, 5000)
+
+        # -- Act --
+
+        # Derive the budget
+        schedulerProcess.getAdaptiveSchedulerBudget(self.mocked_cursor, self.helper_resHallID, self.helper_numRAs)
+
+        # -- Assert --
+
+        # Assert that the successful runs and the runs that ran out of budget
+        #  for the hall with a similar number of RAs were loaded
+        query, params = self.mocked_cursor.execute.call_args[0]
+        self.assertIn("(status = %s OR budget_exhausted)", query)
+        self.assertEqual(
+            (self.helper_resHallID,
+             self.helper_numRAs - schedulerProcess.ADAPTIVE_BUDGET_RA_RANGE,
+             self.helper_numRAs + schedulerProcess.ADAPTIVE_BUDGET_RA_RANGE,
+             Schedule.SUCCESS,
+             schedulerProcess.ADAPTIVE_BUDGET_HISTORY_SIZE),
+            params
+        )
+
+    def test_withSlowRuns_capsBudgetAtConfiguredMaximums(self):
+        # Test to ensure that when the runs in the hall's history needed more than
+        #  the configured maximums, the timeout is capped at the
+        #  SCHEDULER_ADAPTIVE_MAX_TIMEOUT and the node budget is capped at the
+        #  SCHEDULER_NODE_BUDGET.
+
+        # -- Arrange --
+
+        # Configure the cursor to return percentiles above the maximums
+        self.mocked_cursor.fetchone.return_value = (20, 25.0, 150000)
+
+        # -- Act --
+
+        # Derive the budget
+        result = schedulerProcess.getAdaptiveSchedulerBudget(
+            self.mocked_cursor, self.helper_resHallID, self.helper_numRAs
+        )
+
+        # -- Assert --
+
+        # Assert that the budget was capped
+        self.assertEqual((30, 200000), result)
+
+    def test_withFastRuns_raisesBudgetToMinimums(self):
+        # Test to ensure that when the runs in the hall's history needed very
+        #  little time and few nodes, the budget is not lowered below the
+        #  minimum timeout and node budget.
+
+        # -- Arrange --
+
+        # Configure the cursor to return percentiles below the minimums
+        self.mocked_cursor.fetchone.return_value = (20, 0.01, 10)
+
+        # -- Act --
+
+        # Derive the budget
+        result = schedulerProcess.getAdaptiveSchedulerBudget(
+            self.mocked_cursor, self.helper_resHallID, self.helper_numRAs
+        )
+
+        # -- Assert --
+
+        # Assert that the minimums were used
+        self.assertEqual(
+            (schedulerProcess.ADAPTIVE_BUDGET_MIN_TIMEOUT, schedulerProcess.ADAPTIVE_BUDGET_MIN_NODES),
+            result
+        )
+
+    def test_withoutNodeCounts_usesConfiguredNodeBudget(self):
+        # Test to ensure that when the runs in the hall's history were recorded
+        #  without a node count, the SCHEDULER_NODE_BUDGET is used.
+
+        # -- Arrange --
+
+        # Configure the cursor to return runs without a node count
+        self.mocked_cursor.fetchone.return_value = (20, 1.5, None)
+
+        # -- Act --
+
+        # Derive the budget
+        result = schedulerProcess.getAdaptiveSchedulerBudget(
+            self.mocked_cursor, self.helper_resHallID, self.helper_numRAs
+        )
+
+        # -- Assert --
+
+        # Assert that the configured node budget was used
+        self.assertEqual((3.0, 200000), result)
+
+    def test_withoutConfiguredNodeBudget_doesNotCapNodeBudget(self):
+        # Test to ensure that when the SCHEDULER_NODE_BUDGET is 0, meaning the
+        #  runs are not limited by nodes, the derived node budget is not capped.
+
+        # -- Arrange --
+
+        # Disable the configured node budget
+        self.helper_osEnviron["SCHEDULER_NODE_BUDGET"] = "0"
+
+        # Configure the cursor to return the percentiles of the runs
+        self.mocked_cursor.fetchone.return_value = (20, 1.5, 150000)
+
+        # -- Act --
+
+        # Derive the budget
+        with patch.dict("os.environ", self.helper_osEnviron):
+            result = schedulerProcess.getAdaptiveSchedulerBudget(
+                self.mocked_cursor, self.helper_resHallID, self.helper_numRAs
+            )
+
+        # -- Assert --
+
+        # Assert that the derived node budget was used
+        self.assertEqual((3.0, 300000), result)
@@ -0,0 +1,78 @@
+from schedule.ra_sched import Schedule
+from unittest.mock import MagicMock
+import schedulerProcess
+import unittest
+
+
+class TestSchedulerProcess_recordSchedulerRunHistory(unittest.TestCase):
+    def setUp(self):
+        # Set up a number of items that will be used for these tests.
+
+        # -- Create a cursor for the run history to be recorded with --
+        self.mocked_cursor = MagicMock()
+
+        # Set the values that are used throughout
+        self.helper_resHallID = 1
+        self.helper_numRAs = 10
+
+    def test_recordsWhetherEachAttemptRanOutOfBudget(self):
+        # Test to ensure that each attempt is recorded along with whether it ran
+        #  out of time or nodes so that these attempts can be used to grow the
+        #  hall's future budgets.
+
+        # -- Arrange --
+
+        # Create the attempts that were made
+        desiredAttempts = [
+            (5, Schedule.FAIL, 2.0, False, None, {"nodes": 20000, "budgetExhausted": 1}),
+            (4, Schedule.FAIL, 0.5, False, None, {"nodes": 3000, "budgetExhausted": 0}),
+            (3, Schedule.SUCCESS, 0.25, False, None, {"nodes": 500, "budgetExhausted": 0})
+        ]
+
+        # -- Act --
+
+        # Record the attempts
+        schedulerProcess.recordSchedulerRunHistory(
+            self.mocked_cursor, self.helper_resHallID, self.helper_numRAs, desiredAttempts
+        )
+
+        # -- Assert --
+
+        # Assert that each attempt was recorded with whether it ran out of budget
+        _, rows = self.mocked_cursor.executemany.call_args[0]
+        self.assertEqual(
+            [
+                (self.helper_resHallID, self.helper_numRAs, 5, Schedule.FAIL, 2.0, 20000, True),
+                (self.helper_resHallID, self.helper_numRAs, 4, Schedule.FAIL, 0.5, 3000, False),
+                (self.helper_resHallID, self.helper_numRAs, 3, Schedule.SUCCESS, 0.25, 500, False)
+            ],
+            rows
+        )
+
+    def test_doesNotRecordMemoizedAttempts(self):
+        # Test to ensure that the attempts whose results were memoized are not
+        #  recorded since the scheduler was not run for them.
+
+        # -- Arrange --
+
+        # Create the attempts that were made
+        desiredAttempts = [
+            (5, Schedule.FAIL, 0, True, None, {}),
+            (4, Schedule.SUCCESS, 0.5, False, None, {"nodes": 3000, "budgetExhausted": 0})
+        ]
+
+        # -- Act --
+
+        # Record the attempts
+        schedulerProcess.recordSchedulerRunHistory(
+            self.mocked_cursor, self.helper_resHallID, self.helper_numRAs, desiredAttempts
+        )
+
+        # -- Assert --
+
+        # Assert that only the attempt that was run was recorded
+        _, rows = self.mocked_cursor.executemany.call_args[0]
+        self.assertEqual(
+            [(self.helper_resHallID, self.helper_numRAs, 4, Schedule.SUCCESS, 0.5, 3000, False)],
+            rows
+        )
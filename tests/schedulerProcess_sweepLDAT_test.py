@@ -0,0 +1,180 @@
+from schedule.ra_sched import Schedule, RA
+from unittest.mock import patch
+from datetime import date
+import schedulerProcess
+import functools
+import unittest
+
+
+# The LDAT values that the stubbed scheduler is able to generate a schedule
+#  for. This is set before each sweep so that the forked worker processes
+#  used by the parallel sweep and the portfolio receive the same value.
+stubFeasibleLDATs = set()
+
+
+def stubSchedule(raList, year=2021, month=10, noDutyDates=None, ldaTolerance=1, seed=None, **kwargs):
+    # Stand in for the scheduler algorithm. A schedule is generated if the
+    #  provided LDAT is one of the stubFeasibleLDATs and fails otherwise.
+    if ldaTolerance in stubFeasibleLDATs:
+        return Schedule(year, month, noDutyDates, [], status=Schedule.SUCCESS)
+
+    return Schedule(year, month, noDutyDates, [], status=Schedule.FAIL)
+
+
+class TestSchedulerProcess_sweepLDAT(unittest.TestCase):
+    def setUp(self):
+        # Set up a number of items that will be used for these tests.
+
+        # -- Create a patcher for the scheduler algorithm --
+        self.patcher_schedule = patch.object(schedulerProcess.scheduler4_3, "schedule", stubSchedule)
+        self.patcher_schedule.start()
+
+        # -- Create a patcher for the LDAT memo so that each test starts empty --
+        self.patcher_ldatMemo = patch.dict(schedulerProcess.ldatFeasibilityMemo, clear=True)
+        self.patcher_ldatMemo.start()
+
+        # -- Create a patchers for the logging --
+        self.patcher_loggingDEBUG = patch("logging.debug", autospec=True)
+        self.patcher_loggingINFO = patch("logging.info", autospec=True)
+        self.patcher_loggingWARNING = patch("logging.warning", autospec=True)
+        self.patcher_loggingCRITICAL = patch("logging.critical", autospec=True)
+        self.patcher_loggingERROR = patch("logging.error", autospec=True)
+
+        # Start the patcher - mock returned
+        self.mocked_loggingDEBUG = self.patcher_loggingDEBUG.start()
+        self.mocked_loggingINFO = self.patcher_loggingINFO.start()
+        self.mocked_loggingWARNING = self.patcher_loggingWARNING.start()
+        self.mocked_loggingCRITICAL = self.patcher_loggingCRITICAL.start()
+        self.mocked_loggingERROR = self.patcher_loggingERROR.start()
+
+        # -- Create the inputs for the sweeps --
+        self.helper_raList = [RA("Test", "RA{}".format(i), i, 1, date(2020, 1, 1), points=i) for i in range(4)]
+        self.helper_noDutyList = []
+        self.helper_schedulerArgs = {"year": 2021, "month": 10}
+        self.helper_ldat = 8
+
+    def tearDown(self):
+        # Stop all of the patchers
+        self.patcher_schedule.stop()
+        self.patcher_ldatMemo.stop()
+
+        # Stop all of the logging patchers
+        self.patcher_loggingDEBUG.stop()
+        self.patcher_loggingINFO.stop()
+        self.patcher_loggingWARNING.stop()
+        self.patcher_loggingCRITICAL.stop()
+        self.patcher_loggingERROR.stop()
+
+        # Reset the LDAT values the stubbed scheduler can generate a schedule for
+        stubFeasibleLDATs.clear()
+
+    def runSweep(self, sweep, **kwargs):
+        # Helper method to run the provided sweep with the inputs for these
+        #  tests and return the resulting schedule status and LDAT.
+        sched, ldat, _ = sweep(
+            self.helper_raList, self.helper_noDutyList, self.helper_schedulerArgs, self.helper_ldat, **kwargs
+        )
+
+        return sched.getStatus(), ldat
+
+    def test_withMonotoneFeasibility_eachSweepPicksSameLDATAsLinear(self):
+        # Test to ensure that when every LDAT at or below a threshold is able
+        #  to generate a schedule, each of the sweeps picks the same LDAT as
+        #  the linear sweep. This includes when every LDAT works and when
+        #  none of them do.
+
+        for threshold in range(self.helper_ldat + 1):
+            with self.subTest(threshold=threshold):
+                # -- Arrange --
+
+                # Set the LDAT values that can generate a schedule
+                stubFeasibleLDATs.clear()
+                stubFeasibleLDATs.update(range(1, threshold + 1))
+
+                # Clear out any memoized results from the previous threshold
+                schedulerProcess.ldatFeasibilityMemo.clear()
+
+                # -- Act --
+
+                # Run the linear sweep to get the expected result
+                expectedResult = self.runSweep(schedulerProcess.sweepLDATLinear)
+
+                # Run each of the other sweeps
+                bisectResult = self.runSweep(schedulerProcess.sweepLDATBisect)
+                parallelResult = self.runSweep(schedulerProcess.sweepLDATParallel, numWorkers=2)
+
+                # -- Assert --
+
+                # Assert that the linear sweep picked the threshold
+                if threshold == 0:
+                    self.assertEqual((Schedule.FAIL, 1), expectedResult)
+                else:
+                    self.assertEqual((Schedule.SUCCESS, threshold), expectedResult)
+
+                # Assert that the other sweeps picked the same LDAT
+                self.assertEqual(expectedResult, bisectResult)
+                self.assertEqual(expectedResult, parallelResult)
+
+    def test_withPortfolio_eachSweepPicksSameLDATAsLinear(self):
+        # Test to ensure that when each attempt is made with a portfolio of
+        #  seeded runs, the linear and bisect sweeps pick the same LDAT as the
+        #  linear sweep does with a single run.
+
+        # -- Arrange --
+
+        # Set the LDAT values that can generate a schedule
+        stubFeasibleLDATs.update(range(1, 6))
+
+        # Create the portfolio attempts
+        runFirstAttempt = functools.partial(schedulerProcess.runPortfolioSchedulerAttempt, portfolioSize=2)
+        runFairestAttempt = functools.partial(
+            schedulerProcess.runPortfolioSchedulerAttempt, portfolioSize=2, pickFairest=True
+        )
+
+        # -- Act --
+
+        # Run the linear sweep to get the expected result
+        expectedResult = self.runSweep(schedulerProcess.sweepLDATLinear)
+
+        # Run the sweeps with each of the portfolio attempts
+        results = [
+            self.runSweep(sweep, runAttempt=runAttempt)
+            for sweep in (schedulerProcess.sweepLDATLinear, schedulerProcess.sweepLDATBisect)
+            for runAttempt in (runFirstAttempt, runFairestAttempt)
+        ]
+
+        # -- Assert --
+
+        # Assert that the expected LDAT was picked
+        self.assertEqual((Schedule.SUCCESS, 5), expectedResult)
+
+        # Assert that each of the portfolio sweeps picked the same LDAT
+        for result in results:
+            self.assertEqual(expectedResult, result)
+
+    def test_withNonMonotoneFeasibility_bisectPicksAnLDATThatGeneratesASchedule(self):
+        # Test to ensure that when the LDAT values that can generate a schedule
+        #  are not contiguous, the bisect sweep still returns a schedule from
+        #  one of those values rather than reporting a failure. The bisect
+        #  sweep assumes that feasibility only changes once as the LDAT
+        #  decreases, so it is not guaranteed to find the highest LDAT.
+
+        # -- Arrange --
+
+        # Set the LDAT values that can generate a schedule
+        stubFeasibleLDATs.update({1, 2, 7})
+
+        # -- Act --
+
+        # Run the linear and bisect sweeps
+        linearStatus, linearLDAT = self.runSweep(schedulerProcess.sweepLDATLinear)
+        bisectStatus, bisectLDAT = self.runSweep(schedulerProcess.sweepLDATBisect)
+
+        # -- Assert --
+
+        # Assert that the linear sweep picked the highest LDAT
+        self.assertEqual((Schedule.SUCCESS, 7), (linearStatus, linearLDAT))
+
+        # Assert that the bisect sweep picked an LDAT that generates a schedule
+        self.assertEqual(Schedule.SUCCESS, bisectStatus)
+        self.assertIn(bisectLDAT, stubFeasibleLDATs)